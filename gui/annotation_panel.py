@@ -20,6 +20,11 @@ class AnnotationPanel(QGroupBox):
         self.setMaximumHeight(480)
         layout = QVBoxLayout(self)
 
+        # Mode label styles (built once, reused on every mode switch)
+        self.FRAME_MODE_STYLE = "font-weight: bold; color: #333;"
+        self.SEGMENT_MODE_STYLE = "font-weight: bold; color: #007acc;"
+        self.navigation_mode = "frame"
+
         # Current navigation mode display
         self.mode_label = QLabel("Mode: Frame Navigation")
         self.mode_label.setStyleSheet(
@@ -104,9 +109,15 @@ class AnnotationPanel(QGroupBox):
 
     def set_navigation_mode(self, mode):
         """Update navigation mode display"""
+        if mode == self.navigation_mode:
+            return
+
         if mode == "frame":
             self.mode_label.setText("Mode: Frame Navigation")
-            self.mode_label.setStyleSheet("font-weight: bold; color: #333;")
+            self.mode_label.setStyleSheet(self.FRAME_MODE_STYLE)
         elif mode == "segment":
             self.mode_label.setText("Mode: Segment Navigation")
-            self.mode_label.setStyleSheet("font-weight: bold; color: #007acc;")
\ No newline at end of file
+            self.mode_label.setStyleSheet(self.SEGMENT_MODE_STYLE)
+        else:
+            return
+        self.navigation_mode = mode
\ No newline at end of file
@@ -2,11 +2,20 @@
 Bounding Box Annotation Dialog with Manual Track ID Selection
 """
 
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
-                            QLabel, QComboBox, QLineEdit, 
-                            QPushButton, QMessageBox, QSpinBox, QCheckBox)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeySequence, QShortcut
+import logging
+
+from PySide6.QtWidgets import (QDialog, QFormLayout, QHBoxLayout, 
+                            QLabel, QComboBox, QFrame, QDialogButtonBox,
+                            QSpinBox, QCheckBox)
+from PySide6.QtCore import Qt, QTimer
+
+logger = logging.getLogger(__name__)
+
+# Keys the spin box hands to the dialog instead of handling itself
+FORWARD_KEYS = frozenset({
+    int(Qt.Key_W), int(Qt.Key_S), int(Qt.Key_Return),
+    int(Qt.Key_Enter), int(Qt.Key_Space), int(Qt.Key_Escape),
+})
 
 
 class CustomSpinBox(QSpinBox):
@@ -23,7 +32,7 @@ class CustomSpinBox(QSpinBox):
             return
 
         # W/S/Enter/Space -> Dialog
-        if event.key() in (Qt.Key_W, Qt.Key_S, Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space, Qt.Key_Escape):
+        if int(event.key()) in FORWARD_KEYS:
             self.parent_dialog.keyPressEvent(event)
             return
         
@@ -42,35 +51,41 @@ class BBoxAnnotationDialog(QDialog):
         self.setAttribute(Qt.WA_DeleteOnClose, False)
         
         self.available_objects = available_objects
-        self.existing_track_ids = existing_track_ids or {}
-        self.current_frame_track_ids = current_frame_track_ids or []
+        # Own frozen snapshot: the caller's per-type lists are never aliased
+        self.existing_track_ids = {object_type: frozenset(track_ids)
+                                   for object_type, track_ids in (existing_track_ids or {}).items()}
+        self.current_frame_track_ids = frozenset(current_frame_track_ids or ()) # O(1) duplicate check
         self.last_selected_object = last_selected_object
+        self.suggested_numbers = self.parse_track_numbers(self.existing_track_ids) # Dict[object_type: int]
         
         self.result_object_type = None
         self.result_track_id = None
         self.result_is_static = False
+
+        # Coalesce W/S key-repeat bursts into one display update per ~frame
+        self.pending_track_number = 1
+        self.current_object_type = ""
+        self.track_id_format = None # e.g. "person_{:03d}", set on object change
+        self.track_update_timer = QTimer(self)
+        self.track_update_timer.setSingleShot(True)
+        self.track_update_timer.setInterval(16)
+        self.track_update_timer.timeout.connect(self.apply_track_update)
         
         self.setup_ui()
         self.setup_shortcuts()
         
     def setup_ui(self):
         """Setup dialog UI"""
-        layout = QVBoxLayout(self)
+        layout = QFormLayout(self)
         
         # Object type selection
-        object_layout = QHBoxLayout()
-        object_layout.addWidget(QLabel("Object Type:"))
-        
         self.object_combo = QComboBox()
         self.object_combo.addItems(self.available_objects)
         self.object_combo.currentTextChanged.connect(self.on_object_changed)
-        object_layout.addWidget(self.object_combo)
-        
-        layout.addLayout(object_layout)
+        layout.addRow("Object Type:", self.object_combo)
         
         # Track ID input with SpinBox
         track_layout = QHBoxLayout()
-        track_layout.addWidget(QLabel("Track ID:"))
         
         # Object prefix (readonly)
         self.track_prefix_label = QLabel("")
@@ -92,10 +107,14 @@ class BBoxAnnotationDialog(QDialog):
         arrow_label.setStyleSheet("font-size: 14px; color: #666;")
         
         # Full track ID display (readonly)
-        self.track_full_display = QLineEdit()
-        self.track_full_display.setReadOnly(True)
-        self.track_full_display.setStyleSheet("background-color: #f0f0f0;")
-        self.track_full_display.setFocusPolicy(Qt.NoFocus)
+        self.track_full_display = QLabel("")
+        self.track_full_display.setFrameShape(QFrame.StyledPanel)
+        # Style switched by 'state' property: repolish instead of reparsing CSS per update
+        self.track_full_display.setStyleSheet(
+            "QLabel { background-color: #f0f0f0; padding: 2px; }"
+            "QLabel[state=\"ok\"] { background-color: #ccffcc; color: green; }"
+            "QLabel[state=\"duplicate\"] { background-color: #ffcccc; color: red; }"
+        )
         
         # Add all to track layout
         track_layout.addWidget(self.track_prefix_label)
@@ -103,28 +122,25 @@ class BBoxAnnotationDialog(QDialog):
         track_layout.addWidget(arrow_label)
         track_layout.addWidget(self.track_full_display)
         
-        layout.addLayout(track_layout)
+        layout.addRow("Track ID:", track_layout)
 
         # Static Object Checkbox
-        static_layout = QHBoxLayout()
         self.static_checkbox = QCheckBox("Static")
         self.static_checkbox.setToolTip("Check if the object stays in the same position across all frames")
-        static_layout.addWidget(self.static_checkbox)
-        layout.addLayout(static_layout)
+        # Inline validation message (cheaper than a modal QMessageBox)
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: red;")
+        layout.addRow(self.static_checkbox, self.status_label)
         
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        self.ok_button = QPushButton("OK (Enter/Space)")
+        # Buttons (OK validates first, so it is not wired to the box's accepted signal)
+        button_box = QDialogButtonBox()
+        self.ok_button = button_box.addButton("OK (Enter/Space)", QDialogButtonBox.AcceptRole)
         self.ok_button.clicked.connect(self.accept_annotation)
         
-        self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.clicked.connect(self.reject)
-        
-        button_layout.addWidget(self.ok_button)
-        button_layout.addWidget(self.cancel_button)
+        self.cancel_button = button_box.addButton(QDialogButtonBox.Cancel)
+        button_box.rejected.connect(self.reject)
         
-        layout.addLayout(button_layout)
+        layout.addRow(button_box)
 
         if self.last_selected_object and self.last_selected_object in self.available_objects:
             index = self.available_objects.index(self.last_selected_object)
@@ -140,120 +156,143 @@ class BBoxAnnotationDialog(QDialog):
         # Enter key
         self.ok_button.setDefault(True)
         
-        # ESC key for cancel
-        self.escape_shortcut = QShortcut(QKeySequence(Qt.Key_Escape), self)
-        self.escape_shortcut.activated.connect(self.reject)
-        self.escape_shortcut.setContext(Qt.WidgetShortcut)
+        # Key -> handler table for keyPressEvent (handlers return True when the key is consumed)
+        self.key_actions = {
+            int(Qt.Key_Return): self.confirm_by_key,
+            int(Qt.Key_Enter): self.confirm_by_key,
+            int(Qt.Key_Space): self.confirm_by_key,
+            int(Qt.Key_Escape): self.cancel_by_key,
+            int(Qt.Key_W): self.increase_track_number,
+            int(Qt.Key_S): self.decrease_track_number,
+        }
     
     def keyPressEvent(self, event):
         """Handle key press events"""
-
-        # Enter & Space bar
-        if event.key() in (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space):
-            if self.ok_button.isEnabled():
-                self.accept_annotation()
-                event.accept()
-                return
-
-        # ESC
-        elif event.key() == Qt.Key_Escape:
-            self.reject()
-            event.accept()
-            return
-        
-        # W: Increase Track ID
-        elif event.key() == Qt.Key_W:
-            current_value = self.track_number_spinbox.value()
-            max_value = self.track_number_spinbox.maximum()
-            if current_value < max_value:
-                self.track_number_spinbox.setValue(current_value+1)
-
-            print(f'Track ID increased to {self.track_number_spinbox.value()}')
-            event.accept()
-            return
-
-        # S: Decrease Track ID
-        elif event.key() == Qt.Key_S:
-            current_value = self.track_number_spinbox.value()
-            min_value = self.track_number_spinbox.minimum()
-            if current_value > min_value:
-                self.track_number_spinbox.setValue(current_value-1)
-
-            print(f'Track ID decreased to {self.track_number_spinbox.value()}')
+        action = self.key_actions.get(int(event.key()))
+        if action is not None and action():
             event.accept()
             return
 
         super().keyPressEvent(event)
+    
+    def confirm_by_key(self):
+        """Enter & Space bar: accept if current track ID is valid"""
+        if self.track_update_timer.isActive():
+            self.flush_track_update()
+        if not self.ok_button.isEnabled():
+            return False
+        self.accept_annotation()
+        return True
+    
+    def cancel_by_key(self):
+        """ESC: cancel dialog"""
+        self.reject()
+        return True
+    
+    def increase_track_number(self):
+        """W: Increase Track ID"""
+        self.track_number_spinbox.stepUp()
+        logger.debug('Track ID increased to %d', self.track_number_spinbox.value())
+        return True
+    
+    def decrease_track_number(self):
+        """S: Decrease Track ID"""
+        self.track_number_spinbox.stepDown()
+        logger.debug('Track ID decreased to %d', self.track_number_spinbox.value())
+        return True
             
     def on_object_changed(self, object_type):
         """Handle object type change"""
         if not object_type:
             return
         
+        self.current_object_type = object_type
+
         # Update prefix label
         self.track_prefix_label.setText(f"{object_type}_")
+        self.track_id_format = object_type + "_{:03d}"
         
         # Suggest next available number (but user can change it)
         suggested_number = self.get_suggested_number(object_type)
+        # Silent setValue: the display is updated once below, not again via valueChanged
+        self.track_number_spinbox.blockSignals(True)
         self.track_number_spinbox.setValue(suggested_number)
-        self.on_track_number_changed(suggested_number)
+        self.track_number_spinbox.blockSignals(False)
+        self.pending_track_number = suggested_number
+        self.flush_track_update()
     
     def get_suggested_number(self, object_type):
         """Get suggested number for object type"""
-        if object_type in self.existing_track_ids and self.existing_track_ids[object_type]:
-            # Extract numbers from existing track IDs
-            existing_numbers = []
-            for track_id in self.existing_track_ids[object_type]:
-                if track_id.startswith(f"{object_type}_"):
-                    try:
-                        number = int(track_id.split("_")[-1])
-                        existing_numbers.append(number)
-                    except ValueError:
-                        continue
-            
-            # Suggest the most recently used number (for tracking continuity)
-            if existing_numbers:
-                return max(existing_numbers)
-            else:
-                return 1
-        else:
-            return 1
+        # Suggest the most recently used number (for tracking continuity)
+        return self.suggested_numbers.get(object_type, 1)
+    
+    @staticmethod
+    def parse_track_number(track_id):
+        """Numeric suffix of a track ID ('person_003' -> 3), None if not numeric"""
+        try:
+            return int(track_id.rsplit("_", 1)[-1])
+        except ValueError:
+            return None
+    
+    def parse_track_numbers(self, existing_track_ids):
+        """Parse highest track number per object type once"""
+        suggested_numbers = {}
+        # Track IDs are always built as f"{object_type}_{number:03d}", so no prefix check is needed
+        for object_type, track_ids in existing_track_ids.items():
+            numbers = [self.parse_track_number(track_id) for track_id in track_ids]
+            numbers = [number for number in numbers if number is not None]
+            if numbers:
+                suggested_numbers[object_type] = max(numbers)
+        return suggested_numbers
     
     def on_track_number_changed(self, number):
-        """Handle track number change"""
-        object_type = self.object_combo.currentText()
-        if not object_type:
+        """Handle track number change (display update is deferred)"""
+        self.pending_track_number = number
+        self.track_update_timer.start()
+    
+    def flush_track_update(self):
+        """Apply a pending track number update immediately"""
+        self.track_update_timer.stop()
+        self.apply_track_update()
+    
+    def apply_track_update(self):
+        """Update track ID display and OK button for the latest track number"""
+        if self.track_id_format is None:
             return
             
-        track_id = f"{object_type}_{number:03d}"
+        track_id = self.track_id_format.format(self.pending_track_number)
         self.track_full_display.setText(track_id)
         
         # Check if this track ID already exists in current frame
-        if track_id in self.current_frame_track_ids:
-            self.track_full_display.setStyleSheet("background-color: #ffcccc; color: red;")
-            self.ok_button.setEnabled(False)
-        else:
-            self.track_full_display.setStyleSheet("background-color: #ccffcc; color: green;")
-            self.ok_button.setEnabled(True)
+        is_duplicate = track_id in self.current_frame_track_ids
+        state = "duplicate" if is_duplicate else "ok"
+        if self.track_full_display.property("state") != state:
+            self.track_full_display.setProperty("state", state)
+            style = self.track_full_display.style()
+            style.unpolish(self.track_full_display)
+            style.polish(self.track_full_display)
+        self.ok_button.setEnabled(not is_duplicate)
+        self.status_label.clear()
     
     def accept_annotation(self):
         """Accept and validate annotation"""
-        object_type = self.object_combo.currentText()
+        if self.track_update_timer.isActive():
+            self.flush_track_update()
+        
+        object_type = self.current_object_type
         track_id = self.track_full_display.text().strip()
         
         if not object_type:
-            QMessageBox.warning(self, "Error", "Please select an object type")
+            self.status_label.setText("Please select an object type")
             return
             
         if not track_id:
-            QMessageBox.warning(self, "Error", "Please enter a track ID")
+            self.status_label.setText("Please enter a track ID")
             return
             
         # Check for duplicate track ID only in current frame
         if track_id in self.current_frame_track_ids:
-            QMessageBox.warning(self, "Error", 
-                            f"Track ID '{track_id}' already exists in current frame.\n"
-                            f"Please use a different track ID for this frame.")
+            self.status_label.setText(f"'{track_id}' already exists in this frame")
             return
             
         self.result_object_type = object_type
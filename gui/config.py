@@ -6,7 +6,7 @@ MIN_PANEL_WIDTH = 550
 DEFAULT_360_MODE = False
 PADDING_RATIO = 0.25
 
-track_id_color_palette = [
+track_id_color_palette = (
             (0, 255, 0),    # Green
             (0, 0, 255),    # Blue  
             (255, 255, 0),  # Yellow
@@ -17,4 +17,4 @@ track_id_color_palette = [
             (255, 192, 203), # Pink
             (0, 128, 128),  # Teal
             (128, 128, 0),  # Olive
-        ]
\ No newline at end of file
+        )
@@ -0,0 +1,55 @@
+"""
+Background Frame Prefetch (decodes upcoming segment frames into VideoCanvas.frame_cache)
+"""
+
+import cv2
+
+from PySide6.QtCore import QRunnable
+
+
+class FramePrefetcher(QRunnable):
+    """Decode frames with the canvas prefetch capture (runs on VideoCanvas.prefetch_pool)"""
+
+    def __init__(self, canvas, video_path, generation, frame_indices):
+        super().__init__()
+        self.canvas = canvas
+        self.video_path = video_path
+        self.generation = generation
+        self.frame_indices = frame_indices
+
+    def run(self):
+        """Decode frames not yet cached, stop when the canvas loads another video"""
+        canvas = self.canvas
+
+        # prefetch_cap is only touched from prefetch_pool (single thread)
+        if canvas.prefetch_cap_path != self.video_path:
+            if canvas.prefetch_cap is not None:
+                canvas.prefetch_cap.release()
+            canvas.prefetch_cap = cv2.VideoCapture(self.video_path)
+            canvas.prefetch_cap_path = self.video_path
+            canvas.prefetch_decoded_frame = -1
+
+        # Ascending order: nearby frames are reached by decoding forward (grab)
+        # instead of a seek that restarts from the previous keyframe
+        for frame_index in sorted(self.frame_indices):
+            if canvas.video_generation != self.generation:
+                return
+            if canvas.get_cached_frame(frame_index) is not None:
+                continue
+
+            gap = frame_index - canvas.prefetch_decoded_frame - 1
+            need_seek = not (0 <= gap <= canvas.max_grab_gap)
+            if not need_seek:
+                for _ in range(gap):
+                    if not canvas.prefetch_cap.grab():
+                        need_seek = True
+                        break
+            if need_seek:
+                canvas.prefetch_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+
+            ret, frame = canvas.prefetch_cap.read()
+            if not ret:
+                canvas.prefetch_decoded_frame = -1
+                return
+            canvas.prefetch_decoded_frame = frame_index
+            canvas.cache_frame(frame_index, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame), self.generation)
@@ -0,0 +1,109 @@
+"""
+Annotation JSON File I/O (uses orjson when installed, stdlib json otherwise)
+"""
+
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(file_path):
+    """Load and parse JSON file"""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dumps_json(obj):
+    """Serialize to indent=2 UTF-8 bytes (same layout with orjson or json)"""
+    # OPT_NON_STR_KEYS: annotations are keyed by int frame index (json.dumps writes them as "5")
+    # Float text may differ between backends (1e-07 vs 1e-7), both parse to the same value
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_SERIALIZE_NUMPY)
+
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def append_grounding(file_path, grounding):
+    """Append one grounding by rewriting only the file tail (False if layout is not recognized)"""
+    # Expected layout: json.dump(indent=2) of a dict whose last key is "groundings"
+    with open(file_path, 'r+b') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 64))
+        tail = f.read()
+        content_end = size - (len(tail) - len(tail.rstrip()))
+        tail = tail.rstrip()
+
+        if tail.endswith(b'}\n  ]\n}'):
+            # Non-empty list: insert after the last grounding object
+            insert_at = content_end - len(b'\n  ]\n}')
+            separator = b',\n'
+        elif tail.endswith(b'"groundings": []\n}'):
+            # Empty list: insert inside the brackets
+            insert_at = content_end - len(b']\n}')
+            separator = b'\n'
+        else:
+            return False
+
+        text = b'\n'.join(b'    ' + line for line in dumps_json(grounding).splitlines())
+
+        f.seek(insert_at)
+        f.write(separator + text + b'\n  ]\n}')
+        f.truncate()
+    return True
+
+
+def save_grounding(file_path, video_info, grounding, data=None, grounding_id=None, mtime=None):
+    """Add grounding to annotation file (created if missing), returns (grounding_id, document, mtime)"""
+    # data: 이미 파싱된 문서 (캐시) - 없을 때만 파일을 읽음
+    # grounding_id: 호출자가 알고 있는 다음 ID - 없을 때만 기존 ID에서 계산
+    # mtime: data를 읽거나 쓴 시점의 파일 수정 시각 - 다르면 외부에서 바뀐 것이므로 다시 읽음
+    if data is not None and (mtime is None or not os.path.exists(file_path)
+                             or os.path.getmtime(file_path) != mtime):
+        data = None
+        grounding_id = None
+
+    if data is None:
+        file_exists = os.path.exists(file_path)
+        if file_exists:
+            data = load_json(file_path)
+        else:
+            data = {"video_info": video_info, "groundings": []}
+    else:
+        file_exists = True
+
+    # 새 grounding ID 생성
+    if grounding_id is None:
+        grounding_id = max((g.get('grounding_id', 0) for g in data['groundings']), default=0) + 1
+
+    new_grounding = {"grounding_id": grounding_id, **grounding}
+    data["groundings"].append(new_grounding)
+
+    # 파일 저장: 기존 파일은 끝에 grounding만 이어 쓰기, 실패 시 전체 다시 쓰기
+    # 이어 쓰기는 파일을 제자리에서 고치므로 원자적이지 않음 (쓰는 도중 중단되면 끝부분이 깨질 수 있음)
+    appended = (file_exists and next(reversed(data)) == "groundings"
+                and append_grounding(file_path, new_grounding))
+    if not appended:
+        # 임시 파일에 쓴 뒤 교체: 쓰는 도중 실패해도 기존 파일은 그대로
+        content = dumps_json(data) # Serialize first: a serialization error leaves no temp file
+        temp_path = file_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    return grounding_id, data, os.path.getmtime(file_path)
+
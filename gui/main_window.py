@@ -4,10 +4,9 @@ Main Window for Video QA Annotation Tool
 """
 
 import os
-import json
 from datetime import datetime
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot, QSettings, QTimer, QThreadPool
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -29,10 +28,11 @@ from gui.annotation_panel import AnnotationPanel
 from gui.object_panel import ObjectPanel
 from gui.qa_panel import QAPanel
 from gui.config import PANEL_WIDTH, DEFAULT_360_MODE, HALF_PANEL_WIDTH
+from gui.json_io import load_json
+from gui.save_worker import SaveWorker
 from gui.video_canvas import VideoCanvas
 
 
-
 class MainWindow(QMainWindow):
     """Main Application Window"""
 
@@ -42,7 +42,7 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1450, 700)
 
         # Annotation State
-        self.sampled_frames = []
+        self.sampled_frames = range(0) # range: O(1) membership / .index() without a frame list
         self.current_segment_index = 0
         
         # 360 Video Mode Status (Padding for Bbox)
@@ -55,6 +55,72 @@ class MainWindow(QMainWindow):
 
         # Current Working JSON File
         self.current_json_file = None
+        self.current_annotation_document = None # Parsed current_json_file, reused by saves
+        self.next_grounding_id = None # Known with current_annotation_document, None = read from file
+        self.current_annotation_mtime = None # File mtime the cached document matches
+
+        # File dialogs: fixed filters, last used directories persisted across sessions
+        self.VIDEO_FILE_FILTER = "Video files (*.mp4 *.avi *.mov *.mkv);;All files (*.*)"
+        self.JSON_FILE_FILTER = "JSON files (*.json);;All files (*.*)"
+        self.settings = QSettings("KwonPodo", "VQA_Annotator")
+        self.last_video_dir = self.settings.value("last_video_dir", "")
+        self.last_annotation_dir = self.settings.value("last_annotation_dir", "")
+
+        # Background save state
+        self.save_in_progress = False
+        self.save_buttons_enabled = False # Wanted Save / Save As state, applied once no save is running
+        self.save_success_message = ""
+
+        # Keyboard navigation: key events queued here, applied once per event-loop pass
+        self.pending_nav_steps = 0 # C/V: segments in segment mode, frames otherwise
+        self.pending_nav_frames = 0 # D/F: frames
+        self.nav_timer = QTimer(self)
+        self.nav_timer.setSingleShot(True)
+        self.nav_timer.setInterval(0)
+        self.nav_timer.timeout.connect(self.flush_navigation)
+
+        # Segment buttons: rapid clicks only decode the last requested frame
+        self.SEEK_DEBOUNCE_MS = 40
+        self.pending_seek_frame = None
+        self.seek_timer = QTimer(self)
+        self.seek_timer.setSingleShot(True)
+        self.seek_timer.setInterval(self.SEEK_DEBOUNCE_MS)
+        self.seek_timer.timeout.connect(self.apply_pending_seek)
+
+        # Segment frames decoded ahead of navigation (VideoCanvas.prefetch_frames)
+        self.PREFETCH_SEGMENTS = 3
+
+        # Held C/V/D/F: OS key repeat is off, navigation repeats at a fixed rate instead
+        self.NAV_REPEAT_DELAY = 300 # ms before first repeat
+        self.NAV_REPEAT_INTERVAL = 66 # ms between repeats (~15 Hz)
+        self.nav_key_actions = {} # Dict[key: navigation slot]
+        self.held_nav_key = None
+        self.nav_repeat_timer = QTimer(self)
+        self.nav_repeat_timer.timeout.connect(self.repeat_held_navigation)
+
+        # While scrubbing with a held key, frames are scaled fast; smooth again after SCRUB_END_MS
+        self.SCRUB_END_MS = 150
+        self.scrub_end_timer = QTimer(self)
+        self.scrub_end_timer.setSingleShot(True)
+        self.scrub_end_timer.setInterval(self.SCRUB_END_MS)
+        self.scrub_end_timer.timeout.connect(self.end_scrubbing)
+
+        # Label updates requested during one event-loop pass are applied once in flush_ui
+        self.ui_dirty = set() # {'frame_info', 'progress', 'status'}
+        self.pending_status_message = ""
+        self.progress_stale = False # Progress refresh skipped while QA tab was shown
+        self.ui_flush_timer = QTimer(self)
+        self.ui_flush_timer.setSingleShot(True)
+        self.ui_flush_timer.setInterval(0)
+        self.ui_flush_timer.timeout.connect(self.flush_ui)
+
+        # Last text set on frequently updated labels (see set_label_text)
+        self.label_texts = {} # Dict[QLabel: str]
+
+        # Widgets created in setup_ui / setup_keyboard_shortcuts
+        self.tab_widget = None
+        self.qa_panel = None
+        self.a_shortcut = None
 
         # Setup
         self.setup_ui()
@@ -111,9 +177,9 @@ class MainWindow(QMainWindow):
         self.save_annotation_btn = QPushButton("Save")
         self.save_as_btn = QPushButton("Save As...")
 
+        # Size from app.qss (QPushButton[cls="fileop"])
         for btn in [self.load_video_btn, self.load_annotation_btn, self.save_annotation_btn, self.save_as_btn]:
-            btn.setMinimumWidth(120)
-            btn.setMinimumHeight(32)
+            btn.setProperty("cls", "fileop")
 
         file_layout.addWidget(self.load_video_btn)
         file_layout.addWidget(self.load_annotation_btn)
@@ -177,9 +243,9 @@ class MainWindow(QMainWindow):
         grounding_tab = self.create_grounding_tab()
         self.tab_widget.addTab(grounding_tab, "Grounding")
         
-        # QA Tab
-        qa_tab = self.create_qa_tab()
-        self.tab_widget.addTab(qa_tab, "QA")
+        # QA Tab: placeholder, real panel is built on first activation (ensure_qa_panel)
+        self.qa_placeholder = QWidget()
+        self.tab_widget.addTab(self.qa_placeholder, "QA")
         
         # Tab Changed Callback
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
@@ -213,20 +279,13 @@ class MainWindow(QMainWindow):
         
         # Status Label
         self.annotation_status_label = QLabel("Load video and select objects to start annotation")
-        self.annotation_status_label.setStyleSheet(
-            "color: #666; font-style: italic; padding: 8px; "
-            "border: 1px solid #ddd; border-radius: 3px; "
-            "background-color: #f9f9f9;"
-        )
+        self.annotation_status_label.setObjectName("annotationStatus") # Styled in gui/app.qss
         self.annotation_status_label.setAlignment(Qt.AlignCenter)
 
         # Progress Label
         self.progress_label = QLabel('Progress: Not Started')
-        self.progress_label.setStyleSheet(
-            "color: #333; font-weight: bold; padding: 10px; "
-            "border: 2px solid #9E9E9E; border-radius: 5px; "
-            "background-color: #f5f5f5; font-size: 12px;"
-        )
+        self.progress_label.setObjectName("progress") # Styled in gui/app.qss
+        self.progress_label.setProperty("state", "idle")
         self.progress_label.setAlignment(Qt.AlignCenter)
 
         # Button Layout
@@ -234,12 +293,12 @@ class MainWindow(QMainWindow):
 
         # 1. Undo Last BBox
         self.undo_bbox_btn = QPushButton("↩️ Remove Last BBox")
-        self.undo_bbox_btn.setMinimumHeight(35)
+        self.undo_bbox_btn.setProperty("cls", "gr-action")
         self.undo_bbox_btn.setEnabled(False)
 
         # 2. New Grounding (Restart)
         self.new_grounding_btn = QPushButton('🆕 New Grounding')
-        self.new_grounding_btn.setMinimumHeight(35)
+        self.new_grounding_btn.setProperty("cls", "gr-action")
         self.new_grounding_btn.setEnabled(False)
 
         button_layout.addWidget(self.undo_bbox_btn)
@@ -272,6 +331,28 @@ class MainWindow(QMainWindow):
         
         return tab
     
+    def ensure_qa_panel(self):
+        """Build QA tab in place of its placeholder on first use"""
+        if self.qa_panel is not None:
+            return
+
+        qa_tab = self.create_qa_tab()
+        self.qa_panel.qa_data_changed.connect(self.on_qa_data_changed)
+        if self.sampled_frames:
+            self.qa_panel.set_available_time_segments(self.sampled_frames)
+
+        # Swap tabs without re-entering on_tab_changed
+        index = self.tab_widget.indexOf(self.qa_placeholder)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, qa_tab, "QA")
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+
+        self.qa_placeholder.deleteLater()
+        self.qa_placeholder = None
+
+    @Slot(int)
     def on_tab_changed(self, index):
         """Handle tab change"""
         tab_names = ["Grounding", "QA"]
@@ -280,6 +361,7 @@ class MainWindow(QMainWindow):
             
             # Update track_ids when switching to QA tab
             if index == 1:  # QA tab
+                self.ensure_qa_panel()
                 self.update_qa_panel_track_ids()
 
                 # Disable A Key on QA Tab
@@ -287,6 +369,9 @@ class MainWindow(QMainWindow):
             else:
                 self.a_shortcut.setEnabled(True)
 
+                if self.progress_stale:
+                    self.update_progress_display()
+
     def setup_connections(self):
         """Setup signal connections"""
         # File operations
@@ -312,35 +397,26 @@ class MainWindow(QMainWindow):
         # Object Panel selection change detector
         self.object_panel.connect_selection_changed(self.on_object_selection_changed)
 
-        self.annotation_panel.start_frame_input.editingFinished.connect(lambda: self.setFocus())
-        self.annotation_panel.end_frame_input.editingFinished.connect(lambda: self.setFocus())
-        self.annotation_panel.interval_input.editingFinished.connect(lambda: self.setFocus())
-
-        if hasattr(self, 'qa_panel'):
-            self.qa_panel.qa_data_changed.connect(self.on_qa_data_changed)
+        # Queued: hand focus back after the spinbox's own focus-out handling has finished
+        self.annotation_panel.start_frame_input.editingFinished.connect(self.refocus, Qt.QueuedConnection)
+        self.annotation_panel.end_frame_input.editingFinished.connect(self.refocus, Qt.QueuedConnection)
+        self.annotation_panel.interval_input.editingFinished.connect(self.refocus, Qt.QueuedConnection)
 
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
 
-        # C Mapping: Prev 1 Frame
-        self.c_shortcut = QShortcut(QKeySequence(Qt.Key_C), self)
-        self.c_shortcut.activated.connect(self.navigate_prev)
-        self.c_shortcut.setContext(Qt.WindowShortcut)
-
-        # V Mapping: Next 1 Frame
-        self.v_shortcut = QShortcut(QKeySequence(Qt.Key_V), self)
-        self.v_shortcut.activated.connect(self.navigate_next)
-        self.v_shortcut.setContext(Qt.WindowShortcut)
-
-        # D Mapping: Next 10 Frame
-        self.d_shortcut = QShortcut(QKeySequence(Qt.Key_D), self)
-        self.d_shortcut.activated.connect(lambda: self.prev_n_frame(10))
-        self.d_shortcut.setContext(Qt.WindowShortcut)
-
-        # F Mapping: Next 10 Frame
-        self.f_shortcut = QShortcut(QKeySequence(Qt.Key_F), self)
-        self.f_shortcut.activated.connect(lambda: self.next_n_frame(10))
-        self.f_shortcut.setContext(Qt.WindowShortcut)
+        # C/V Mapping: Prev/Next 1 Frame (segment), D/F Mapping: Prev/Next 10 Frame
+        # Auto repeat off: holding the key repeats via nav_repeat_timer (see keyReleaseEvent)
+        self.nav_key_actions = {
+            Qt.Key_C: self.queue_prev_step,
+            Qt.Key_V: self.queue_next_step,
+            Qt.Key_D: self.prev_10_frame,
+            Qt.Key_F: self.next_10_frame,
+        }
+        self.c_shortcut = self.create_nav_shortcut(Qt.Key_C)
+        self.v_shortcut = self.create_nav_shortcut(Qt.Key_V)
+        self.d_shortcut = self.create_nav_shortcut(Qt.Key_D)
+        self.f_shortcut = self.create_nav_shortcut(Qt.Key_F)
 
         # A Mapping: Apply Time Segment
         self.a_shortcut = QShortcut(QKeySequence(Qt.Key_A), self)
@@ -363,17 +439,67 @@ class MainWindow(QMainWindow):
         self.new_grounding_shortcut.activated.connect(self.start_new_grounding)
         self.new_grounding_shortcut.setContext(Qt.WindowShortcut)
 
+    def create_nav_shortcut(self, key):
+        """Navigation key shortcut without OS auto repeat"""
+        shortcut = QShortcut(QKeySequence(key), self)
+        shortcut.setAutoRepeat(False)
+        shortcut.setContext(Qt.WindowShortcut)
+        shortcut.activated.connect(lambda: self.press_nav_key(key))
+        return shortcut
+
+    def press_nav_key(self, key):
+        """Navigate once and keep repeating while the key is held"""
+        self.nav_key_actions[key]()
+        self.held_nav_key = key
+        self.nav_repeat_timer.start(self.NAV_REPEAT_DELAY)
+
+    @Slot()
+    def repeat_held_navigation(self):
+        """Repeat held navigation key at NAV_REPEAT_INTERVAL"""
+        # Release may go to a dialog / other window - stop instead of running away
+        if self.held_nav_key is None or not self.isActiveWindow():
+            self.stop_nav_repeat()
+            return
+
+        if self.nav_repeat_timer.interval() != self.NAV_REPEAT_INTERVAL:
+            self.nav_repeat_timer.setInterval(self.NAV_REPEAT_INTERVAL)
+        self.video_canvas.set_fast_preview(True)
+        self.scrub_end_timer.start()
+        self.nav_key_actions[self.held_nav_key]()
+
+    @Slot()
+    def end_scrubbing(self):
+        """Redraw current frame with smooth scaling once scrubbing stopped"""
+        self.video_canvas.set_fast_preview(False)
+
+    def stop_nav_repeat(self):
+        """Stop held key navigation"""
+        self.held_nav_key = None
+        self.nav_repeat_timer.stop()
+
+    def keyReleaseEvent(self, event):
+        """Stop repeating when held navigation key is released"""
+        if not event.isAutoRepeat() and event.key() == self.held_nav_key:
+            self.stop_nav_repeat()
+            event.accept()
+            return
+        super().keyReleaseEvent(event)
+
     # Event handlers
+    @Slot()
     def load_video(self):
         """Load video file"""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Video File",
-            "",
-            "Video files (*.mp4 *.avi *.mov *.mkv);;All files (*.*)",
+            self.last_video_dir,
+            self.VIDEO_FILE_FILTER,
         )
 
         if file_path:
+            self.last_video_dir = os.path.dirname(file_path)
+            self.settings.setValue("last_video_dir", self.last_video_dir)
+
             if self.video_canvas.load_video(file_path):
                 self.current_video_name = os.path.splitext(os.path.basename(file_path))[0]
                 print(f"Successfully loaded video: {file_path}")
@@ -400,77 +526,117 @@ class MainWindow(QMainWindow):
         """When Load Video, Rest all status"""
         # 1. Reset JSON File Path
         self.current_json_file = None
+        self.set_annotation_document(None)
 
-        # 2. Reset Annotation Data
-        self.current_annotation_data = None
-        self.sampled_frames = []
-        self.current_segment_index = 0
+        # 2. Reset grounding state (annotation data, canvas, panels, buttons, progress, tab)
+        self.reset_grounding_state('Progress: Not Started')
 
-        # 3. Reset Video Canvas
-        self.video_canvas.disable_bbox_mode()
-        self.video_canvas.frame_bboxes = {}
-        self.video_canvas.existing_track_ids = {}
-        self.video_canvas.track_registry = {}
-        self.video_canvas.color_index = 0
-        self.video_canvas.edit_mode = False
-        self.video_canvas.selected_bbox = None
-        self.video_canvas.selected_bbox_index = None
-        self.video_canvas.is_drawing = False
-        self.video_canvas.last_selected_object_type = None
-        self.video_canvas.update()
-
-        # 4. Reset Object Panel
+        # 3. Reset video-specific controls
         self.object_panel.clear_selection()
-        self.object_panel.setEnabled(True)
-
-        # 5. Reset Annotation Panel
+        self.new_grounding_btn.setEnabled(True)
         self.annotation_panel.apply_segment_btn.setEnabled(False)
-        self.annotation_panel.undo_segment_btn.setEnabled(False)
-        self.annotation_panel.set_navigation_mode('frame')
         self.annotation_panel.start_frame_input.setValue(0)
         self.annotation_panel.end_frame_input.setValue(0)
         self.annotation_panel.interval_input.setValue(10)
+        if self.qa_panel is not None:
+            self.qa_panel.sampled_frames = None
 
-        # 6. Reset QA Panel
-        if hasattr(self, 'qa_panel'):
-            self.qa_panel.reset_qa_panel()
-            self.qa_panel.set_available_track_ids([])
-            if hasattr(self.qa_panel, 'sampled_frames'):
-                delattr(self.qa_panel, 'sampled_frames')
+        # 4. Keyboard Shortcuts Reset
+        self.a_shortcut.setEnabled(True)
         
-        # 7. Reset Navigation Button Status
-        self.prev_segment_btn.setEnabled(False)
-        self.next_segment_btn.setEnabled(False)
+        print("Load Video: Overall Status Reset Complete.")
 
-        # 8. Reset Action Button Status
-        self.new_grounding_btn.setEnabled(True)
-        self.undo_bbox_btn.setEnabled(False)
-        self.save_annotation_btn.setEnabled(False)
-        self.save_as_btn.setEnabled(False)
-
-        # 9. Reset Progress
-        self.progress_label.setText('Progress: Not Started')
-        self.progress_label.setStyleSheet(
-            "color: #333; font-weight: bold; padding: 10px; "
-            "border: 2px solid #9E9E9E; border-radius: 5px; "
-            "background-color: #f5f5f5; font-size: 12px;"
-        )
+    def reset_grounding_state(self, progress_text):
+        """Reset state shared by new video / new grounding / segment undo"""
+        # Apply all widget changes with a single repaint at the end
+        self.setUpdatesEnabled(False)
+        try:
+            # 1. Deactivate Bbox mode
+            if self.video_canvas.bbox_mode:
+                self.video_canvas.disable_bbox_mode()
+
+            # 2. Reset Annotation data
+            self.current_annotation_data = None
+            self.set_sampled_frames(range(0))
+            self.current_segment_index = 0
+
+            # 3. Reset VideoCanvas Annotation data
+            self.video_canvas.clear_annotations()
+            self.video_canvas.edit_mode = False
+            self.video_canvas.selected_bbox = None
+            self.video_canvas.selected_bbox_index = None
+            self.video_canvas.is_drawing = False
+            self.video_canvas.last_selected_object_type = None
+
+            # 4. Reset Object / Annotation panel (object selection is kept here)
+            self.object_panel.setEnabled(True)
+            self.annotation_panel.undo_segment_btn.setEnabled(False)
+            self.annotation_panel.set_navigation_mode('frame')
+
+            # 5. Reset QA Panel
+            if self.qa_panel is not None:
+                self.qa_panel.reset_qa_panel()
+                self.qa_panel.set_available_track_ids([])
 
-        # 10. Reset Tab to Grounding Tab
-        if hasattr(self, 'tab_widget'):
+            # 6. Navigation Button status
+            self.prev_segment_btn.setEnabled(False)
+            self.next_segment_btn.setEnabled(False)
+
+            # 7. Action Button Status
+            self.undo_bbox_btn.setEnabled(False)
+            self.set_save_buttons_enabled(False)
+
+            # 8. Reset Progress
+            self.set_label_text(self.progress_label, progress_text)
+            self.set_progress_state("idle")
+            self.ui_dirty.discard('progress') # Reset text wins over a pending refresh
+            self.progress_stale = False
+
+            # 9. Move to Grounding Tab
             self.tab_widget.setCurrentIndex(0)
-        
-        # 11. Keyboard Shortcuts Reset
-        if hasattr(self, 'a_shortcut'):
-            self.a_shortcut.setEnabled(True)
-        
-        print("Load Video: Overall Status Reset Complete.")
+        finally:
+            # Painting must come back even if a reset step raises
+            self.setUpdatesEnabled(True)
+            self.video_canvas.update()
+
+    def set_sampled_frames(self, sampled_frames):
+        """Set sampled frames (range)"""
+        self.sampled_frames = sampled_frames
+        self.video_canvas.set_sampled_frames(sampled_frames)
+        self.pending_seek_frame = None # Segment seek of previous time segment
+
+    def mark_ui_dirty(self, part):
+        """Request label update, applied once at next event-loop pass"""
+        self.ui_dirty.add(part)
+        if not self.ui_flush_timer.isActive():
+            self.ui_flush_timer.start()
+
+    @Slot()
+    def flush_ui(self):
+        """Apply requested label updates (each at most once)"""
+        dirty = self.ui_dirty
+        self.ui_dirty = set()
+
+        if 'frame_info' in dirty:
+            self.refresh_frame_info()
+        if 'progress' in dirty:
+            # Progress label is on the Grounding tab: refresh when it is shown again
+            if self.tab_widget.currentIndex() == 0:
+                self.refresh_progress_display()
+            else:
+                self.progress_stale = True
+        if 'status' in dirty:
+            self.set_label_text(self.annotation_status_label, self.pending_status_message)
 
     def update_frame_info(self):
+        """Request frame information update"""
+        self.mark_ui_dirty('frame_info')
+
+    def refresh_frame_info(self):
         """Update frame information display 0-Indexing"""
 
         if not self.video_canvas.video_cap:
-            self.frame_info_label.setText('Frame: - / -')
+            self.set_label_text(self.frame_info_label, 'Frame: - / -')
             return
         
         # Frame Index Info
@@ -490,10 +656,21 @@ class MainWindow(QMainWindow):
 
             frame_info += segment_info
 
-        self.frame_info_label.setText(frame_info)
+        self.set_label_text(self.frame_info_label, frame_info)
 
+    def set_label_text(self, label, text):
+        """setText only when text changed (navigation / progress updates repeat same text)"""
+        if self.label_texts.get(label) == text:
+            return
+        self.label_texts[label] = text
+        label.setText(text)
+
+    @Slot()
     def save_annotation(self):
         """Save annotation - 첫 저장시 Save As 처럼 동작"""
+        if self.save_in_progress:
+            return
+
         if not self.get_current_annotation_with_qa():
             QMessageBox.warning(self, "No Annotation", "No annotation to save")
             return
@@ -503,94 +680,122 @@ class MainWindow(QMainWindow):
             default_filename = f"{self.current_video_name}.json"
             
             file_path, _ = QFileDialog.getSaveFileName(
-                self, "Save Annotation", default_filename,
-                "JSON files (*.json);;All files (*.*)"
+                self, "Save Annotation", os.path.join(self.last_annotation_dir, default_filename),
+                self.JSON_FILE_FILTER
             )
             
             if not file_path:
                 return  # 사용자가 취소한 경우
             
+            self.remember_annotation_dir(file_path)
             self.current_json_file = file_path
+            self.set_annotation_document(None)
         
-        # 파일 저장 실행
-        if self.save_to_file(self.current_json_file):
-            # 저장 성공 시 통계 표시
-            bbox_count = sum(len(bboxes) for bboxes in self.video_canvas.frame_bboxes.values())
-            qa_count = len(self.qa_panel.get_all_qa_data()) if hasattr(self, 'qa_panel') else 0
-            
-            QMessageBox.information(self, "Save Success", 
-                                f"Annotation saved to {os.path.basename(self.current_json_file)}\n"
-                                f"• {bbox_count} bounding boxes\n"
-                                f"• {qa_count} QA sessions")
-        else:
-            QMessageBox.critical(self, "Save Failed", "Failed to save annotation")
+        # 파일 저장 실행 (저장 성공 시 통계 표시)
+        bbox_count = self.video_canvas.bbox_count
+        qa_count = self.get_qa_count()
+        self.save_to_file(self.current_json_file,
+                          f"Annotation saved to {os.path.basename(self.current_json_file)}\n"
+                          f"• {bbox_count} bounding boxes\n"
+                          f"• {qa_count} QA sessions")
 
+    @Slot()
     def save_as_new_file(self):
         """Save as new file"""
+        if self.save_in_progress:
+            return
+
         default_filename = f"{self.current_video_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Annotation As", default_filename, "JSON files (*.json);;All files (*.*)"
+            self, "Save Annotation As", os.path.join(self.last_annotation_dir, default_filename), self.JSON_FILE_FILTER
         )
         
         if file_path:
+            self.remember_annotation_dir(file_path)
             self.current_json_file = file_path
-            if self.save_to_file(file_path):
-                QMessageBox.information(self, "Save Success", f"Annotation saved to {os.path.basename(file_path)}")
-            else:
-                QMessageBox.critical(self, "Save Failed", "Failed to save annotation")
+            self.set_annotation_document(None)
+            self.save_to_file(file_path, f"Annotation saved to {os.path.basename(file_path)}")
+
+    def remember_annotation_dir(self, file_path):
+        """Store directory of chosen annotation file for next file dialog"""
+        self.last_annotation_dir = os.path.dirname(file_path)
+        self.settings.setValue("last_annotation_dir", self.last_annotation_dir)
+
+    def save_to_file(self, file_path, success_message):
+        """Start saving current grounding in background - video-centric structure"""
+        current_annotation = self.get_current_annotation_with_qa()
+
+        # Payload is built here on the GUI thread; the worker only does file I/O
+        video_info = {
+            "filename": self.current_video_name,
+            "total_frames": self.video_canvas.total_frames,
+            "fps": self.video_canvas.fps,
+            "resolution": {
+                "width": self.video_canvas.video_resolution[0],
+                "height": self.video_canvas.video_resolution[1]
+            }
+        }
+        grounding = {
+            "created_at": datetime.now().isoformat(),
+            "time_segment": current_annotation["time_segment"],
+            "selected_objects": current_annotation["selected_objects"],
+            "annotations": current_annotation["annotations"],
+            "qa_sessions": current_annotation.get("qa_data", [])
+        }
 
-    def save_to_file(self, file_path):
-        """Actual file saving logic - video-centric structure"""
-        try:
-            # Load existing file if it exists
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        self.save_success_message = success_message
+        self.set_save_in_progress(True)
+
+        worker = SaveWorker(file_path, video_info, grounding,
+                            self.current_annotation_document, self.next_grounding_id,
+                            self.current_annotation_mtime)
+        worker.signals.finished.connect(self.on_save_finished)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(bool, str, str, object, float)
+    def on_save_finished(self, success, file_path, message, document, mtime):
+        """Show background save result"""
+        self.set_save_in_progress(False)
+        print(message)
+
+        # 저장된 문서를 다음 저장에 재사용 (실패 시 파일과 어긋날 수 있으므로 폐기)
+        if file_path == self.current_json_file:
+            if document is None:
+                self.set_annotation_document(None)
             else:
-                data = {
-                    "video_info": {
-                        "filename": self.current_video_name,
-                        "total_frames": self.video_canvas.total_frames,
-                        "fps": self.video_canvas.fps,
-                        "resolution": {
-                            "width": self.video_canvas.video_resolution[0],
-                            "height": self.video_canvas.video_resolution[1]
-                        }
-                    },
-                    "groundings": []
-                }
-        
-            current_annotation = self.get_current_annotation_with_qa()
-            
-            # 새 grounding ID 생성
-            existing_ids = [g.get('grounding_id', 0) for g in data['groundings']]
-            next_id = max(existing_ids) + 1 if existing_ids else 1
-            
-            # 새 grounding 추가
-            new_grounding = {
-                "grounding_id": next_id,
-                "created_at": datetime.now().isoformat(),
-                "time_segment": current_annotation["time_segment"],
-                "selected_objects": current_annotation["selected_objects"],
-                "annotations": current_annotation["annotations"],
-                "qa_sessions": current_annotation.get("qa_data", [])
-            }
-            
-            data["groundings"].append(new_grounding)
-                
-            # 파일 저장
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            grounding_count = len(data["groundings"])
-            print(f"Saved grounding #{next_id} to {file_path} (Total: {grounding_count})")
-            return True
-            
-            
-        except Exception as e:
-            print(f"Error saving: {e}")
-            return False
+                # 방금 추가된 grounding 다음 번호 (전체 목록을 다시 보지 않음)
+                self.current_annotation_document = document
+                self.current_annotation_mtime = mtime
+                self.next_grounding_id = document["groundings"][-1]["grounding_id"] + 1
+
+        if success:
+            QMessageBox.information(self, "Save Success", self.save_success_message)
+        else:
+            QMessageBox.critical(self, "Save Failed", "Failed to save annotation")
 
+    def set_annotation_document(self, document, mtime=None):
+        """Cache parsed annotation document and next grounding id (None to drop)"""
+        self.current_annotation_document = document
+        self.current_annotation_mtime = mtime
+        if document is None:
+            self.next_grounding_id = None
+        else:
+            groundings = document.get("groundings", [])
+            self.next_grounding_id = max((g.get('grounding_id', 0) for g in groundings), default=0) + 1
+
+    def set_save_in_progress(self, in_progress):
+        """Block saving while a background save is running (no concurrent writes)"""
+        self.save_in_progress = in_progress
+        self.set_save_buttons_enabled(self.save_buttons_enabled)
+
+    def set_save_buttons_enabled(self, enabled):
+        """Set Save / Save As state (kept disabled until a running save finishes)"""
+        # Resets / QA changes during a save update the wanted state instead of the buttons
+        self.save_buttons_enabled = enabled
+        self.save_annotation_btn.setEnabled(enabled and not self.save_in_progress)
+        self.save_as_btn.setEnabled(enabled and not self.save_in_progress)
+
+    @Slot()
     def start_new_grounding(self):
         """Start new grounding (확인 후 리셋)"""
         # 현재 작업이 있는지 확인
@@ -600,8 +805,8 @@ class MainWindow(QMainWindow):
             return
         
         # 작업이 날아간다고 경고
-        total_bboxes = sum(len(bboxes) for bboxes in self.video_canvas.frame_bboxes.values()) if self.video_canvas.frame_bboxes else 0
-        total_qas = len(self.qa_panel.get_all_qa_data()) if hasattr(self, 'qa_panel') else 0
+        total_bboxes = self.video_canvas.bbox_count
+        total_qas = self.get_qa_count()
         
         if total_bboxes > 0 or total_qas > 0:
             message = f"Current work will be lost:\n"
@@ -625,72 +830,25 @@ class MainWindow(QMainWindow):
 
     def _has_current_work(self):
         """현재 작업이 있는지 확인"""
-        has_annotation_data = self.current_annotation_data is not None
-        has_bboxes = bool(self.video_canvas.frame_bboxes)
-        has_qa_data = False
-        
-        if hasattr(self, 'qa_panel'):
-            qa_sessions = self.qa_panel.get_all_qa_data()
-            has_qa_data = bool(qa_sessions)
-        
-        return has_annotation_data or has_bboxes or has_qa_data
+        return (self.current_annotation_data is not None
+                or bool(self.video_canvas.frame_bboxes)
+                or self.get_qa_count() > 0)
+
+    def get_qa_count(self):
+        """Number of QA sessions (0 while QA tab has not been opened)"""
+        return self.qa_panel.get_qa_count() if self.qa_panel is not None else 0
 
     def reset_for_new_grounding(self):
         """Reset UI state for new grounding while keeping video loaded"""
-        # Stop any active bbox annotation
-        if self.video_canvas.bbox_mode:
-            self.video_canvas.disable_bbox_mode()
-        
-        # Reset annotation data
-        self.current_annotation_data = None
-        self.sampled_frames = []
-        self.current_segment_index = 0
-        
-        # Reset video canvas annotation data
-        self.video_canvas.frame_bboxes = {}
-        self.video_canvas.existing_track_ids = {}
-        self.video_canvas.track_registry = {}
-        self.video_canvas.color_index = 0
-        self.video_canvas.last_selected_object_type = None
-        self.video_canvas.update()  # Refresh display
-        
-        # Reset navigation
-        self.prev_segment_btn.setEnabled(False)
-        self.next_segment_btn.setEnabled(False)
-        
-        # Reset UI panels
+        self.reset_grounding_state("Progress: Ready for new grounding")
+
         self.object_panel.clear_selection()
-        self.object_panel.setEnabled(True)
-        
-        # Reset annotation panel
-        self.annotation_panel.undo_segment_btn.setEnabled(False)
-        self.annotation_panel.set_navigation_mode('frame')
-        
-        # Reset QA panel
-        if hasattr(self, 'qa_panel'):
-            self.qa_panel.reset_qa_panel()
-        
-        # Reset button states
         self.new_grounding_btn.setEnabled(True)  # Keep enabled for multiple restarts
-        self.undo_bbox_btn.setEnabled(False)
-        self.save_annotation_btn.setEnabled(False)
-        self.save_as_btn.setEnabled(False)
-        
-        # Update status
         self.update_annotation_status("Select objects and apply time segment")
-        self.progress_label.setText("Progress: Ready for new grounding")
-        self.progress_label.setStyleSheet(
-            "color: #333; font-weight: bold; padding: 10px; "
-            "border: 2px solid #9E9E9E; border-radius: 5px; "
-            "background-color: #f5f5f5; font-size: 12px;"
-        )
-        
-        # Switch to grounding tab
-        if hasattr(self, 'tab_widget'):
-            self.tab_widget.setCurrentIndex(0)
         
         print("🔄 Reset completed - ready for new grounding")
 
+    @Slot(int)
     def on_360_mode_changed(self, state):
         """360 Mode State Change"""
         self.is_360_mode = (state == Qt.CheckState.Checked.value)
@@ -725,6 +883,7 @@ class MainWindow(QMainWindow):
                 print(f"Auto-Detect Standard Video: {width}x{height} (ratio: {aspect_ratio:.2f})")
                 self.update_annotation_status(f"360 mode disabled for video ({width}x{height})")
 
+    @Slot()
     def load_annotation(self):
         """기존 영상 annotation 파일을 선택해서 이어서 작업"""
         if not self.current_video_name:
@@ -735,17 +894,19 @@ class MainWindow(QMainWindow):
         default_file = f"{self.current_video_name}.json"
         
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Load Annotation File", default_file,
-            "JSON files (*.json);;All files (*.*)"
+            self, "Load Annotation File", os.path.join(self.last_annotation_dir, default_file),
+            self.JSON_FILE_FILTER
         )
         
         if file_path:
+            self.remember_annotation_dir(file_path)
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                mtime = os.path.getmtime(file_path) # Before reading: a later change forces a reload
+                data = load_json(file_path)
                 
                 # 현재 작업할 파일로 설정
                 self.current_json_file = file_path
+                self.set_annotation_document(data, mtime)
                 groundings = data.get("groundings", [])
                 
                 if groundings:
@@ -764,26 +925,27 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Load Failed", f"Failed to load file: {e}")
 
+    @Slot()
     def navigate_prev(self):
         # Segment mode
         if self.sampled_frames:
             self.prev_segment()
         else: # Frame mode
-            self.prev_n_frame(1)
+            self.queue_navigation(frames=-1) # Coalesced like held keys
 
+    @Slot()
     def navigate_next(self):
         # segment mode
         if self.sampled_frames:
             self.next_segment()
         else: # frame mode
-            self.next_n_frame(1)
+            self.queue_navigation(frames=1) # Coalesced like held keys
 
     def prev_n_frame(self, n):
         """Go to previous n-frame"""
+        self.apply_pending_seek()
         if self.sampled_frames:
-            min_frame = self.sampled_frames[0]
-            max_frame = self.sampled_frames[-1]
-            target_frame = max(min_frame, min(max_frame, self.video_canvas.current_frame - n))
+            target_frame = max(self.sampled_frames[0], min(self.sampled_frames[-1], self.video_canvas.current_frame - n))
 
         else:
             target_frame = max(0, self.video_canvas.current_frame - n)
@@ -793,10 +955,9 @@ class MainWindow(QMainWindow):
 
     def next_n_frame(self, n):
         """Go to next n-frame"""
+        self.apply_pending_seek()
         if self.sampled_frames:
-            min_frame = self.sampled_frames[0]
-            max_frame = self.sampled_frames[-1]
-            target_frame = max(min_frame, min(max_frame, self.video_canvas.current_frame + n))
+            target_frame = max(self.sampled_frames[0], min(self.sampled_frames[-1], self.video_canvas.current_frame + n))
             
         else:
             target_frame = min(self.video_canvas.total_frames - 1, self.video_canvas.current_frame + n)
@@ -804,31 +965,119 @@ class MainWindow(QMainWindow):
         if self.video_canvas.set_frame(target_frame):
             self.update_frame_info()
 
+    @Slot()
+    def queue_prev_step(self):
+        """C Key: Go to previous segment / frame"""
+        self.queue_navigation(steps=-1)
+
+    @Slot()
+    def queue_next_step(self):
+        """V Key: Go to next segment / frame"""
+        self.queue_navigation(steps=1)
+
+    @Slot()
+    def prev_10_frame(self):
+        """D Key: Go to previous 10-frame"""
+        self.queue_navigation(frames=-10)
+
+    @Slot()
+    def next_10_frame(self):
+        """F Key: Go to next 10-frame"""
+        self.queue_navigation(frames=10)
+
+    def queue_navigation(self, steps=0, frames=0):
+        """Accumulate key navigation; held keys decode only the final frame"""
+        self.pending_nav_steps += steps
+        self.pending_nav_frames += frames
+        if not self.nav_timer.isActive():
+            self.nav_timer.start()
+
+    @Slot()
+    def flush_navigation(self):
+        """Apply accumulated key navigation at once"""
+        # Key navigation is relative to the displayed frame: finish a pending button seek first
+        self.apply_pending_seek()
+
+        steps, frames = self.pending_nav_steps, self.pending_nav_frames
+        self.pending_nav_steps = 0
+        self.pending_nav_frames = 0
+
+        if steps:
+            if self.sampled_frames:
+                self.move_n_segment(steps)
+            else:
+                self.move_n_frame(steps)
+        if frames:
+            self.move_n_frame(frames)
+
+    def move_n_frame(self, n):
+        """Go n frames forward (n > 0) or backward (n < 0)"""
+        if n > 0:
+            self.next_n_frame(n)
+        elif n < 0:
+            self.prev_n_frame(-n)
+
+    def move_n_segment(self, n):
+        """Go n segments forward (n > 0) or backward (n < 0)"""
+        if not self.sampled_frames:
+            return
+        target_index = max(0, min(len(self.sampled_frames) - 1, self.current_segment_index + n))
+        if target_index != self.current_segment_index:
+            self.current_segment_index = target_index
+            self.video_canvas.set_frame(self.sampled_frames[target_index])
+            self.update_frame_info()
+            self.prefetch_neighbor_segments()
+
+    @Slot()
+    def refocus(self):
+        """Return keyboard focus to main window (after spinbox editing)"""
+        self.setFocus()
+
+    @Slot()
     def prev_segment(self):
         """Go to previous segment"""
         if self.sampled_frames and self.current_segment_index > 0:
-            self.current_segment_index -= 1
-            frame_num = self.sampled_frames[self.current_segment_index]
-            self.video_canvas.set_frame(frame_num)
-            self.update_frame_info()
-            # print(
-                # f"Navigated to segment {self.current_segment_index} of {len(self.sampled_frames) - 1} (frame {frame_num})"
-            # )
+            self.seek_segment(self.current_segment_index - 1)
 
+    @Slot()
     def next_segment(self):
         """Go to next segment"""
         if (
             self.sampled_frames
             and self.current_segment_index < len(self.sampled_frames) - 1
         ):
-            self.current_segment_index += 1
-            frame_num = self.sampled_frames[self.current_segment_index]
-            self.video_canvas.set_frame(frame_num)
-            self.update_frame_info()
-            # print(
-            #     f"Navigated to segment {self.current_segment_index} of {len(self.sampled_frames) - 1} (frame {frame_num})"
-            # )
+            self.seek_segment(self.current_segment_index + 1)
+
+    def seek_segment(self, segment_index):
+        """Move to segment; frame is decoded once clicks stop for SEEK_DEBOUNCE_MS"""
+        self.current_segment_index = segment_index
+        self.pending_seek_frame = self.sampled_frames[segment_index]
+        self.seek_timer.start()
+
+    def prefetch_neighbor_segments(self):
+        """Decode next / previous segment frames in background"""
+        i = self.current_segment_index
+        frames = list(self.sampled_frames[i + 1:i + 1 + self.PREFETCH_SEGMENTS])
+        if i > 0:
+            frames.append(self.sampled_frames[i - 1])
+        self.video_canvas.prefetch_frames(frames)
+
+    @Slot()
+    def apply_pending_seek(self):
+        """Decode the last requested segment frame"""
+        self.seek_timer.stop()
+        if self.pending_seek_frame is None:
+            return
+        frame_num = self.pending_seek_frame
+        self.pending_seek_frame = None
+        self.video_canvas.set_frame(frame_num)
+        self.update_frame_info()
+        self.prefetch_neighbor_segments()
+        # print(
+            # f"Navigated to segment {self.current_segment_index} of {len(self.sampled_frames) - 1} (frame {frame_num})"
+        # )
 
+    @Slot()
     def apply_time_segment_and_start(self):
         """Apply time segment and automatically start BBox Annotation"""
         if not self.current_video_name:
@@ -846,31 +1095,27 @@ class MainWindow(QMainWindow):
         end_frame = segment_info['end_frame']
         interval = segment_info['interval']
 
-        if start_frame >= end_frame:
-            QMessageBox.warning(self, 'Invalid Segment', 'Start Frame should be smaller than End Frame.')
+        total_frames = self.video_canvas.total_frames
+        if not (0 <= start_frame < end_frame < total_frames):
+            QMessageBox.warning(self, 'Invalid Segment',
+                                f'Need 0 ≤ Start Frame ({start_frame}) < End Frame ({end_frame}) < {total_frames}.')
             return
         
-        if end_frame >= self.video_canvas.total_frames:
-            QMessageBox.warning(self, 'Invalid Segment', 
-                                f'End Frame should be smaller than {self.video_canvas.total_frames}.')
-            return
-        
-        # 2. Uniform Sampling
-        sampled_frames = list(range(start_frame, end_frame+1, interval))
+        # 2. Uniform Sampling (range: indexing / len / membership without a frame list)
+        sampled_frames = range(start_frame, end_frame+1, interval)
         if not sampled_frames:
             QMessageBox.warning(self, 'Invalid Segment', 'No frame sampled with current settings.')
             return
         
-        # 3. Check if previous work exists
-        if self.current_annotation_data is not None or self.video_canvas.frame_bboxes:
-            total_bboxes = sum(len(bboxes) for bboxes in self.video_canvas.frame_bboxes.values())
-            if total_bboxes > 0:
-                result = QMessageBox.question(self, "Start New Annotation", 
-                                            f"Current annotation has {total_bboxes} bounding boxes.\n"
-                                            f"Start new annotation? (Current work will be lost)",
-                                            QMessageBox.Yes | QMessageBox.No)
-                if result == QMessageBox.No:
-                    return
+        # 3. Check if previous work exists (O(1) maintained count; sampled_frames above is a lazy range)
+        total_bboxes = self.video_canvas.bbox_count
+        if total_bboxes > 0:
+            result = QMessageBox.question(self, "Start New Annotation", 
+                                        f"Current annotation has {total_bboxes} bounding boxes.\n"
+                                        f"Start new annotation? (Current work will be lost)",
+                                        QMessageBox.Yes | QMessageBox.No)
+            if result == QMessageBox.No:
+                return
         
         # 4. Initiate Annotation Data
         self.current_annotation_data = {
@@ -887,7 +1132,7 @@ class MainWindow(QMainWindow):
                 'start_frame': sampled_frames[0],
                 'end_frame': sampled_frames[-1],
                 'interval': interval,
-                'sampled_frames': sampled_frames.copy()
+                'sampled_frames': list(sampled_frames) # Saved to JSON, must be a list
             },
             'selected_objects': selected_objects.copy(),
             'annotations': {},
@@ -895,28 +1140,26 @@ class MainWindow(QMainWindow):
         }
 
         # 5. Activate Segment Navigation
-        self.sampled_frames = sampled_frames
+        self.set_sampled_frames(sampled_frames)
         self.current_segment_index = 0
         self.prev_segment_btn.setEnabled(True)
         self.next_segment_btn.setEnabled(True)
 
         # 6. Activate BBox Annotation Mode
-        self.video_canvas.frame_bboxes = {}
-        self.video_canvas.existing_track_ids = {}
-        self.video_canvas.track_registry = {}
-        self.video_canvas.color_index = 0
+        self.video_canvas.clear_annotations()
         self.video_canvas.enable_bbox_mode(selected_objects)
 
         # Move to Segment 0
         self.video_canvas.set_frame(sampled_frames[0])
         self.update_frame_info()
+        self.prefetch_neighbor_segments()
 
         # Update UI
         self.annotation_panel.undo_segment_btn.setEnabled(True)
         self.annotation_panel.set_navigation_mode('segment')
 
         # Init QA Panel
-        if hasattr(self, 'qa_panel'):
+        if self.qa_panel is not None:
             self.qa_panel.reset_qa_panel()
             self.qa_panel.set_available_time_segments(sampled_frames)
         
@@ -933,6 +1176,7 @@ class MainWindow(QMainWindow):
         print(f"Start BBox annotation for: {selected_objects}")
         print(f"Segments: {len(sampled_frames)} frames to annotate")
 
+    @Slot()
     def undo_time_segment(self):
         """Reset annotation data, keep object selection"""
         
@@ -948,150 +1192,86 @@ class MainWindow(QMainWindow):
         print(f"🔄 Reset annotation data - kept object selection: {selected_objects}")
     def reset_annotation_data_only(self):
         """어노테이션 데이터만 초기화 (객체 선택은 유지)"""
-        
-        # 1. Deactivate Bbox mode
-        if self.video_canvas.bbox_mode:
-            self.video_canvas.disable_bbox_mode()
-        
-        # 2. Reset Annotation data
-        self.current_annotation_data = None
-        self.sampled_frames = []
-        self.current_segment_index = 0
-        
-        # 3. Reset VideoCanvas Annotation data
-        self.video_canvas.frame_bboxes = {}
-        self.video_canvas.existing_track_ids = {}
-        self.video_canvas.track_registry = {}
-        self.video_canvas.color_index = 0
-        self.video_canvas.edit_mode = False
-        self.video_canvas.selected_bbox = None
-        self.video_canvas.selected_bbox_index = None
-        self.video_canvas.is_drawing = False
-        self.video_canvas.last_selected_object_type = None
-        self.video_canvas.update()
-        
-        # 4. Reset Annotation panel (Keep object panel)
-        self.object_panel.setEnabled(True)
-        self.annotation_panel.undo_segment_btn.setEnabled(False)
-        self.annotation_panel.set_navigation_mode('frame')
-        
-        # 5. Init QA Panel
-        if hasattr(self, 'qa_panel'):
-            self.qa_panel.reset_qa_panel()
-            self.qa_panel.set_available_track_ids([])
-        
-        # 6. Navigation Button status
-        self.prev_segment_btn.setEnabled(False)
-        self.next_segment_btn.setEnabled(False)
-        
-        # 7. Action Button Status
-        self.undo_bbox_btn.setEnabled(False)
-        self.save_annotation_btn.setEnabled(False)
-        self.save_as_btn.setEnabled(False)
-        
-        # 8. Reset Progress Button
-        self.progress_label.setText('Progress: Not Started')
-        self.progress_label.setStyleSheet(
-            "color: #333; font-weight: bold; padding: 10px; "
-            "border: 2px solid #9E9E9E; border-radius: 5px; "
-            "background-color: #f5f5f5; font-size: 12px;"
-        )
-        
-        # 9. Move to Grounding Tab
-        if hasattr(self, 'tab_widget'):
-            self.tab_widget.setCurrentIndex(0)
-        
-        # 10. Focus
+        self.reset_grounding_state('Progress: Not Started')
         self.setFocus()
 
     def restore_object_selection(self, selected_objects):
         """Restore Selected Objects"""
-        self.object_panel.clear_selection()
-        
-        for category in selected_objects:
-            self.object_panel.all_selected_categories.add(category)
-        
-        for category, checkbox in self.object_panel.checkboxes.items():
-            if category in selected_objects:
-                checkbox.setChecked(True)
+        # One selection change notification instead of one per toggled checkbox
+        self.object_panel.set_selection(selected_objects)
 
     def update_annotation_status(self, message):
-        """Update annotation status label"""
-        self.annotation_status_label.setText(message)
+        """Request annotation status label update (last message wins)"""
+        self.pending_status_message = message
+        self.mark_ui_dirty('status')
 
     def update_progress_display(self):
+        """Request BBox Annotation Progress update (called after every bbox change)"""
+        self.mark_ui_dirty('progress')
+
+    def refresh_progress_display(self):
         """Update BBox Annotation Progress"""
+        self.progress_stale = False
         if not self.sampled_frames:
-            self.progress_label.setText("Progress: No segments defined")
-            self.progress_label.setStyleSheet(
-                "color: #666; padding: 10px; border: 2px solid #9E9E9E; "
-                "border-radius: 5px; background-color: #f5f5f5; font-size: 11px;"
-            )
+            self.set_label_text(self.progress_label, "Progress: No segments defined")
+            self.set_progress_state("empty")
             return
         
+        # Completed segments are tracked by VideoCanvas on bbox add/remove
+        completed_segments = self.video_canvas.completed_segments
         total = len(self.sampled_frames)
-        completed_frames = []
-        
-        for i, frame_idx in enumerate(self.sampled_frames):
-            if frame_idx in self.video_canvas.frame_bboxes and self.video_canvas.frame_bboxes[frame_idx]:
-                completed_frames.append(i)
-        
-        completed = len(completed_frames)
-        remaining = [i for i in range(total) if i not in completed_frames]
+        completed = len(completed_segments)
+        remaining_count = total - completed
         
         # Color according to progress rate
         rate = completed / total if total > 0 else 0.0
         if rate == 1.0:
-            color = "#4CAF50"  # Finish - Green
-            bg_color = "#E8F5E8"
+            state = "complete"  # Finish - Green
             text = f"🎉 Progress: {completed}/{total} segments COMPLETED!"
-        elif rate >= 0.7:
-            color = "#2196F3" # Almost Finished - Blue
-            bg_color = "#FFF3E0"
-            if len(remaining) <= 5:
-                remaining_str = ", ".join(map(str, remaining))
-                text = f"Progress: {completed}/{total} segments | Remaining: [{remaining_str}]"
-            else:
-                text = f"Progress: {completed}/{total} segments | Remaining: {len(remaining)} more"
-        elif rate >= 0.3:
-            color = "#FF9800"  # On Progress - Orange
-            bg_color = "#E3F2FD"
-            if len(remaining) <= 5:
-                remaining_str = ", ".join(map(str, remaining))
-                text = f"Progress: {completed}/{total} segments | Remaining: [{remaining_str}]"
-            else:
-                text = f"Progress: {completed}/{total} segments | Remaining: {len(remaining)} more"
         else:
-            color = "#F44336"  # Start state - Red
-            bg_color = "#FFEBEE"
-            if len(remaining) <= 5:
+            if rate >= 0.7:
+                state = "high" # Almost Finished - Blue
+            elif rate >= 0.3:
+                state = "mid"  # On Progress - Orange
+            else:
+                state = "low"  # Start state - Red
+
+            # List remaining segments only when there are few of them
+            if remaining_count <= 5:
+                remaining = [i for i in range(total) if i not in completed_segments]
                 remaining_str = ", ".join(map(str, remaining))
                 text = f"Progress: {completed}/{total} segments | Remaining: [{remaining_str}]"
             else:
-                text = f"Progress: {completed}/{total} segments | Remaining: {len(remaining)} more"
+                text = f"Progress: {completed}/{total} segments | Remaining: {remaining_count} more"
         
-        self.progress_label.setText(text)
-        self.progress_label.setStyleSheet(
-            f"color: {color}; font-weight: bold; padding: 10px; "
-            f"border: 2px solid {color}; border-radius: 5px; "
-            f"background-color: {bg_color}; font-size: 11px;"
-        )
+        self.set_label_text(self.progress_label, text)
+        self.set_progress_state(state)
 
+    def set_progress_state(self, state):
+        """Switch progress label style (repolish only, no stylesheet parsing)"""
+        if self.progress_label.property("state") == state:
+            return
+        self.progress_label.setProperty("state", state)
+        style = self.progress_label.style()
+        style.unpolish(self.progress_label)
+        style.polish(self.progress_label)
+
+    @Slot()
     def switch_to_qa_tab(self):
         """Switch to QA Tab and update track IDDs"""
-        if hasattr(self, 'tab_widget'):
-            current_tab = self.tab_widget.currentIndex()
+        current_tab = self.tab_widget.currentIndex()
 
-            if current_tab == 0:
-                self.update_qa_panel_track_ids()
+        if current_tab == 0:
+            self.update_qa_panel_track_ids()
 
-                self.tab_widget.setCurrentIndex(1)
-                print('Switched to QA Tab via Q Key')
-            else:
-                # If already in QA Tab, switch back to grounding tab
-                self.tab_widget.setCurrentIndex(0)
-                print('Switched to Grounding Tab via Q Key')
+            self.tab_widget.setCurrentIndex(1)
+            print('Switched to QA Tab via Q Key')
+        else:
+            # If already in QA Tab, switch back to grounding tab
+            self.tab_widget.setCurrentIndex(0)
+            print('Switched to Grounding Tab via Q Key')
 
+    @Slot()
     def on_object_selection_changed(self):
         """Call when Object Panel selection changes"""
         selected_objects = self.object_panel.get_selected_objects()
@@ -1109,18 +1289,19 @@ class MainWindow(QMainWindow):
         elif not has_segments:
             self.update_annotation_status("Apply time segment to continue")
         elif self.current_annotation_data is not None:
-            current_objects = set(self.current_annotation_data["selected_objects"])
-            new_objects = set(selected_objects)
+            # Both lists are sorted (ObjectPanel.get_selected_objects), compare directly
+            current_objects = self.current_annotation_data["selected_objects"]
             
-            if current_objects == new_objects:
+            if current_objects == selected_objects:
                 self.update_annotation_status(f"In progress: {', '.join(selected_objects)}")
             else:
-                current_str = ', '.join(sorted(current_objects))
-                new_str = ', '.join(sorted(new_objects))
+                current_str = ', '.join(current_objects)
+                new_str = ', '.join(selected_objects)
                 self.update_annotation_status(f"Current: {current_str} → Click to restart with: {new_str}")
         else:
             self.update_annotation_status(f"Ready to start: {', '.join(selected_objects)}")
 
+    @Slot()
     def remove_last_bbox(self):
         """Remove last bbox on current frame"""
         if not self.video_canvas.bbox_mode:
@@ -1133,49 +1314,44 @@ class MainWindow(QMainWindow):
 
     def update_qa_panel_track_ids(self):
         """Update QA panel with available track IDs"""
-        if hasattr(self, 'qa_panel') and self.video_canvas.frame_bboxes:
-            # Collect all track_ids
-            all_track_ids = set()
-            for frame_bboxes in self.video_canvas.frame_bboxes.values():
-                for bbox in frame_bboxes:
-                    all_track_ids.add(bbox['track_id'])
-            
-            track_ids = sorted(list(all_track_ids))
-            self.qa_panel.set_available_track_ids(track_ids)
+        if self.qa_panel is None:
+            return
+
+        # Track IDs kept up to date by VideoCanvas on bbox add/remove
+        track_ids = self.video_canvas.get_track_ids()
+        self.qa_panel.set_available_track_ids(track_ids)
+        if track_ids:
             print(f"Updated QA panel with track IDs: {track_ids}")
-        else:
-            if hasattr(self, 'qa_panel'):
-                self.qa_panel.set_available_track_ids([])
 
     def get_current_annotation_with_qa(self):
         """Get current annotation data including QA"""
         if not self.current_annotation_data:
             return None
         
-        # Add QA data
-        annotation_data = self.current_annotation_data.copy()
-
-        # Padded Coords -> Original Coords -> BFoV
-        converted_annotations = {}
-        for frame_idx, bboxes in self.video_canvas.frame_bboxes.items():
-            converted_annotations[frame_idx] = []
-            for bbox in bboxes:
-                converted_bbox = self.video_canvas.convert_bbox_for_save(bbox)
-                converted_annotations[frame_idx].append(converted_bbox)
-
-        annotation_data['annotations'] = converted_annotations
+        # Padded Coords -> Original Coords -> BFoV (frames left empty by deletion are skipped)
+        converted_annotations = {
+            frame_idx: self.video_canvas.convert_bboxes_for_save(bboxes)
+            for frame_idx, bboxes in self.video_canvas.frame_bboxes.items()
+            if bboxes
+        }
 
-        if hasattr(self, 'qa_panel'):
-            annotation_data["qa_data"] = self.qa_panel.get_all_qa_data()
+        # Build result directly (annotations / qa_data are replaced anyway, no copy needed)
+        annotation_data = {
+            'video_info': self.current_annotation_data['video_info'],
+            'time_segment': self.current_annotation_data['time_segment'],
+            'selected_objects': self.current_annotation_data['selected_objects'],
+            'annotations': converted_annotations,
+            'qa_data': self.qa_panel.get_all_qa_data() if self.qa_panel is not None else []
+        }
         
         return annotation_data
 
+    @Slot(object)
     def on_qa_data_changed(self, qa_data):
         """Call when QA data changes"""
         if self.current_annotation_data:
             self.current_annotation_data["qa_data"] = qa_data
-            print(f'QA data changed: {qa_data}\t{len(qa_data)} QAs')
+            print(f'QA data changed: {len(qa_data)} QAs')
         
         # Enable Save Annotation Button
-        self.save_annotation_btn.setEnabled(True)
-        self.save_as_btn.setEnabled(True)
\ No newline at end of file
+        self.set_save_buttons_enabled(True)
\ No newline at end of file
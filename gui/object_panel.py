@@ -355,10 +355,19 @@ class ObjectPanel(QGroupBox):
 
     def clear_selection(self):
         """Clear all selections"""
-        self.all_selected_categories.clear()
-        for checkbox in self.checkboxes.values():
-            checkbox.setChecked(False)
+        self.set_selection(())
+
+    def set_selection(self, categories):
+        """Replace selection with one change notification (checkbox signals blocked)"""
+        self.all_selected_categories = set(categories)
+        for category, checkbox in self.checkboxes.items():
+            checkbox.blockSignals(True)
+            checkbox.setChecked(category in self.all_selected_categories)
+            checkbox.blockSignals(False)
+
         self.update_selected_objects_display()
+        if self.selection_changed_callback is not None:
+            self.selection_changed_callback()
 
     def has_selection(self):
         """Check if any objects are selected"""
@@ -25,6 +25,9 @@ class QAPanel(QGroupBox):
 
         # Current Available Track IDs
         self.available_track_ids = []
+
+        # Sampled frames of current time segment (None until set_available_time_segments)
+        self.sampled_frames = None
         
         # Setup UI
         self.setup_ui()
@@ -307,7 +310,7 @@ class QAPanel(QGroupBox):
         self.temporal_checkboxes.clear()
         self.update_segment_range_limits()
 
-        if not hasattr(self, 'sampled_frames') or not self.sampled_frames:
+        if not self.sampled_frames:
             no_segments_label = QLabel("No segments available")
             no_segments_label.setStyleSheet("color: #666; font-style: italic;")
             self.temporal_layout.addWidget(no_segments_label, 0, 0)
@@ -350,7 +353,7 @@ class QAPanel(QGroupBox):
         for segment_index, checkbox in self.temporal_checkboxes.items():
             if checkbox.isChecked():
                 time_segments.append(segment_index)
-                if hasattr(self, 'sampled_frames') and segment_index < len(self.sampled_frames):
+                if self.sampled_frames is not None and segment_index < len(self.sampled_frames):
                     time_frames.append(self.sampled_frames[segment_index])
         
         try:
@@ -530,6 +533,10 @@ class QAPanel(QGroupBox):
         self.prev_qa_btn.setEnabled(self.current_qa_index > 0)
         self.next_qa_btn.setEnabled(self.current_qa_index < len(self.qa_sessions) - 1)
     
+    def get_qa_count(self):
+        """Get number of saved QA sessions (without copying them)"""
+        return len(self.qa_sessions)
+
     def get_all_qa_data(self):
         """Get all QA sessions data"""
         return self.qa_sessions.copy()
@@ -598,7 +605,7 @@ class QAPanel(QGroupBox):
     
     def apply_segment_range(self):
         """지정된 범위의 세그먼트들을 체크"""
-        if not hasattr(self, 'sampled_frames') or not self.sampled_frames:
+        if not self.sampled_frames:
             QMessageBox.warning(self, "No Segments", "No segments available to select.")
             return
         
@@ -634,7 +641,7 @@ class QAPanel(QGroupBox):
 
     def update_segment_range_limits(self):
         """세그먼트 범위 SpinBox의 최대값 업데이트"""
-        if hasattr(self, 'sampled_frames') and self.sampled_frames:
+        if self.sampled_frames:
             max_idx = len(self.sampled_frames) - 1
             self.start_segment_spinbox.setMaximum(max_idx)
             self.end_segment_spinbox.setMaximum(max_idx)
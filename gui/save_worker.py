@@ -0,0 +1,38 @@
+"""
+Background Annotation Save (file I/O off the GUI thread)
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from gui.json_io import save_grounding
+
+
+class SaveSignals(QObject):
+    """Signals of SaveWorker (QRunnable itself cannot emit)"""
+
+    # success, file_path, message, saved document (None on failure), file mtime after save
+    finished = Signal(bool, str, str, object, float)
+
+
+class SaveWorker(QRunnable):
+    """Write one grounding to annotation file on a QThreadPool thread"""
+
+    def __init__(self, file_path, video_info, grounding, document=None, grounding_id=None, mtime=None):
+        super().__init__()
+        self.file_path = file_path
+        self.video_info = video_info
+        self.grounding = grounding
+        self.document = document
+        self.grounding_id = grounding_id
+        self.mtime = mtime
+        self.signals = SaveSignals()
+
+    def run(self):
+        """Save grounding and report result"""
+        try:
+            grounding_id, document, mtime = save_grounding(
+                self.file_path, self.video_info, self.grounding, self.document, self.grounding_id, self.mtime)
+            message = f"Saved grounding #{grounding_id} to {self.file_path} (Total: {len(document['groundings'])})"
+            self.signals.finished.emit(True, self.file_path, message, document, mtime)
+        except Exception as e:
+            self.signals.finished.emit(False, self.file_path, f"Error saving: {e}", None, 0.0)
@@ -1,8 +1,11 @@
 import math
+import threading
+from collections import Counter, OrderedDict
+
 import cv2
 import numpy as np
 
-from PySide6.QtCore import Qt, QRect
+from PySide6.QtCore import Qt, QRect, QThreadPool
 from PySide6.QtGui import QPixmap, QImage, QCursor, QPen, QColor, QBrush, QPainter
 from PySide6.QtWidgets import (
     QLabel,
@@ -10,6 +13,7 @@ from PySide6.QtWidgets import (
 )
 
 from gui.config import track_id_color_palette, PADDING_RATIO
+from gui.frame_prefetcher import FramePrefetcher
 
 class VideoCanvas(QLabel):
     """Video Display Canvas"""
@@ -31,6 +35,25 @@ class VideoCanvas(QLabel):
         self.video_resolution = (0, 0)
         self.current_frame_data = None # np.ndarray RGB Pixel data
 
+        # Sequential decode: index of the last frame read from video_cap (-1: next read is frame 0)
+        self.decoded_frame = -1
+        self.DEFAULT_GRAB_GAP = 10
+        self.max_grab_gap = self.DEFAULT_GRAB_GAP
+
+        # Decoded frame LRU cache (RGB), also filled by FramePrefetcher on prefetch_pool
+        # Capped by bytes, not frame count: a 4K (or 360 padded) frame is ~4x a 1080p one
+        self.FRAME_CACHE_MAX_BYTES = 512 * 1024 * 1024
+        self.frame_cache = OrderedDict() # OrderedDict[frame_index: np.ndarray], oldest first
+        self.frame_cache_bytes = 0
+        self.frame_cache_lock = threading.Lock()
+        self.video_path = None
+        self.video_generation = 0 # Bumped on load_video, stale prefetch results are dropped
+        self.prefetch_pool = QThreadPool(self)
+        self.prefetch_pool.setMaxThreadCount(1)
+        self.prefetch_cap = None # Second capture, used only on prefetch_pool
+        self.prefetch_cap_path = None
+        self.prefetch_decoded_frame = -1 # Last frame read from prefetch_cap
+
         # Bounding box annotation state
         self.bbox_mode = False
         self.available_objects = [] # objects selected from object panel
@@ -39,17 +62,35 @@ class VideoCanvas(QLabel):
         self.end_point = None
         self.scale_factor = 1.0
 
+        # Displayed pixmap geometry, cached in update_display:
+        # (x_offset, y_offset, pixmap_width, pixmap_height, image_width, image_height)
+        self.display_transform = None
+
+        # Source of the pixmap on screen: frame array and (360 mode, canvas width, canvas height)
+        self.display_frame = None
+        self.display_key = None
+
+        # Held-key scrubbing: scale with FastTransformation until scrubbing stops
+        self.fast_preview = False
+
         # 360 Bbox
         self.BOUNDARY_THRESHOLD = 50
 
         # Store bboxes with track_id
         self.frame_bboxes = {} # Dict[frame_index: List[bbox_list]]
+        self.bbox_count = 0 # Total bboxes over all frames, kept in sync on add/remove
+        self.track_id_counts = Counter() # Counter[track_id: bbox count over all frames]
+
+        # Segment progress: updated only when a frame's bbox list turns empty <-> non-empty
+        self.sampled_frames = range(0) # Sampled frames of the time segment, set by MainWindow
+        self.completed_segments = set() # segment indices with at least one bbox
 
         # Track ID management
-        self.existing_track_ids = {} # Dict[object_type: List[track_id]]
+        self.existing_track_ids = {} # Dict[object_type: Set[track_id]]
 
-        self.track_registry = {} # Dict[object_type: List[track_id]]
-        self.color_palette = track_id_color_palette
+        self.track_registry = {} # Dict[track_id: QColor]
+        self.color_palette = tuple(QColor(*rgb) for rgb in track_id_color_palette) # QColor LUT, built once
+        self.default_bbox_color = QColor(255, 0, 0)
         self.color_index = 0
 
         # Remember last selected object type
@@ -82,11 +123,24 @@ class VideoCanvas(QLabel):
             self.video_cap.release()
 
         self.video_cap = cv2.VideoCapture(file_path)
+        self.decoded_frame = -1
+
+        # Frames of previous video are no longer valid
+        self.prefetch_pool.clear()
+        with self.frame_cache_lock:
+            self.video_generation += 1
+            self.frame_cache.clear()
+            self.frame_cache_bytes = 0
+        self.video_path = file_path
         if self.video_cap.isOpened():
             self.total_frames = int(self.video_cap.get(cv2.CAP_PROP_FRAME_COUNT))
             self.fps = self.video_cap.get(cv2.CAP_PROP_FPS)
             self.current_frame = 0
 
+            # Keyframe interval is usually about one second of video: decoding forward
+            # up to that many frames is cheaper than seeking back to a keyframe
+            self.max_grab_gap = int(self.fps) if self.fps >= 1 else self.DEFAULT_GRAB_GAP
+
             # Load first frame and get dimensions
             self.set_frame(0)
 
@@ -130,29 +184,101 @@ class VideoCanvas(QLabel):
         if not self.video_cap or frame_index < 0 or frame_index >= self.total_frames:
             return False
 
-        self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        cached = self.get_cached_frame(frame_index)
+        if cached is not None:
+            self.show_frame(frame_index, cached)
+            return True
+
+        # Short forward jumps: grab() the frames in between instead of seeking,
+        # since a seek restarts decoding from the previous keyframe
+        gap = frame_index - self.decoded_frame - 1
+        need_seek = not (0 <= gap <= self.max_grab_gap)
+        if not need_seek:
+            for _ in range(gap):
+                if not self.video_cap.grab():
+                    need_seek = True
+                    break
+
+        if need_seek:
+            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
         ret, frame = self.video_cap.read()
 
         if ret:
-            self.current_frame = frame_index
+            self.decoded_frame = frame_index
 
-            # Convert BGR to RGB and store current frame data
-            self.current_frame_data = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch  = self.current_frame_data.shape
-
-            self.original_width = w
-            self.original_height = h
-
-            # Update display with current canvas size
-            self.update_display()
+            # Convert BGR to RGB in place (read() returns a fresh buffer)
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+            self.cache_frame(frame_index, frame, self.video_generation)
+            self.show_frame(frame_index, frame)
 
             return True
+
+        # Decoder position unknown after a failed read, seek next time
+        self.decoded_frame = -1
         return False
 
+    def show_frame(self, frame_index, frame):
+        """Store RGB frame as current frame data and display it"""
+        self.current_frame = frame_index
+        self.current_frame_data = frame
+        h, w, ch  = frame.shape
+
+        self.original_width = w
+        self.original_height = h
+
+        # Update display with current canvas size
+        self.update_display()
+
+    def get_cached_frame(self, frame_index):
+        """Cached RGB frame or None (thread-safe)"""
+        with self.frame_cache_lock:
+            frame = self.frame_cache.get(frame_index)
+            if frame is not None:
+                self.frame_cache.move_to_end(frame_index)
+            return frame
+
+    def cache_frame(self, frame_index, frame, generation):
+        """Add decoded RGB frame, evicting least recently used (thread-safe)"""
+        with self.frame_cache_lock:
+            if generation != self.video_generation:
+                return
+            old = self.frame_cache.pop(frame_index, None)
+            if old is not None:
+                self.frame_cache_bytes -= old.nbytes
+            self.frame_cache[frame_index] = frame
+            self.frame_cache_bytes += frame.nbytes
+
+            # Evict least recently used, but always keep the frame just added
+            while self.frame_cache_bytes > self.FRAME_CACHE_MAX_BYTES and len(self.frame_cache) > 1:
+                _, evicted = self.frame_cache.popitem(last=False)
+                self.frame_cache_bytes -= evicted.nbytes
+
+    def prefetch_frames(self, frame_indices):
+        """Decode frames in background (replaces prefetch requests not started yet)"""
+        if not self.video_cap:
+            return
+        with self.frame_cache_lock:
+            frame_indices = [i for i in frame_indices if i not in self.frame_cache]
+        if not frame_indices:
+            return
+
+        self.prefetch_pool.clear()
+        self.prefetch_pool.start(FramePrefetcher(self, self.video_path, self.video_generation, frame_indices))
+
     def update_display(self):
         """Update video display with current canvas size"""
         if self.current_frame_data is None:
             return
+
+        # Get current canvas size
+        canvas_size = self.size()
+
+        # Same frame, mode and size (e.g. resize to same size, mode re-applied): pixmap is current
+        display_key = (self.is_360_mode, self.fast_preview, canvas_size.width(), canvas_size.height())
+        if self.display_frame is self.current_frame_data and self.display_key == display_key:
+            return
+        self.display_frame = self.current_frame_data
+        self.display_key = display_key
         
         if self.is_360_mode:
             display_image = self.create_360_padded_image(self.current_frame_data)
@@ -167,13 +293,12 @@ class VideoCanvas(QLabel):
             display_image.data, w, h, bytes_per_line, QImage.Format_RGB888
         )
         
-        # Get current canvas size
-        canvas_size = self.size()
-        
-        # Scale to fit current canvas while maintaining aspect ratio
-        scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-            canvas_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        # Scale to fit current canvas while maintaining aspect ratio, then convert
+        # only the display-sized image to a pixmap (not the full-resolution frame)
+        transform = Qt.FastTransformation if self.fast_preview else Qt.SmoothTransformation
+        scaled_pixmap = QPixmap.fromImage(qt_image.scaled(
+            canvas_size, Qt.KeepAspectRatio, transform
+        ))
 
         # Calculate current scale factor
         self.scale_factor = min(
@@ -183,6 +308,24 @@ class VideoCanvas(QLabel):
 
         self.setPixmap(scaled_pixmap)
 
+        # Cache canvas <-> padded coordinate transform for the displayed pixmap
+        self.display_transform = (
+            (canvas_size.width() - scaled_pixmap.width()) // 2,
+            (canvas_size.height() - scaled_pixmap.height()) // 2,
+            scaled_pixmap.width(),
+            scaled_pixmap.height(),
+            w,
+            h,
+        )
+
+    def set_fast_preview(self, enabled):
+        """Toggle fast (nearest) scaling; leaving it redraws current frame smoothly"""
+        if self.fast_preview == enabled:
+            return
+        self.fast_preview = enabled
+        if not enabled:
+            self.update_display()
+
     def resizeEvent(self, event):
         """Handle resize events to update video display"""
         super().resizeEvent(event)
@@ -207,23 +350,69 @@ class VideoCanvas(QLabel):
         print('BBox mode disabled')
     
     def get_next_color(self):
-        """Get next color from color palette"""
+        """Get next QColor from color palette"""
         color = self.color_palette[self.color_index % len(self.color_palette)]
         self.color_index += 1
         return color
     
+    def clear_bboxes(self):
+        """Remove all bboxes of all frames"""
+        # clear() in place: holders of these dicts see the reset too
+        self.frame_bboxes.clear()
+        self.bbox_count = 0
+        self.track_id_counts.clear()
+        self.completed_segments.clear()
+
+    def clear_annotations(self):
+        """Remove all bboxes and track ID / color assignments"""
+        self.clear_bboxes()
+        self.existing_track_ids.clear()
+        self.track_registry.clear()
+        self.color_index = 0
+
+    def set_sampled_frames(self, sampled_frames):
+        """Set sampled frames (range) and recount completed segments"""
+        self.sampled_frames = sampled_frames
+        self.completed_segments = {
+            sampled_frames.index(frame_idx) for frame_idx, bboxes in self.frame_bboxes.items()
+            if bboxes and frame_idx in sampled_frames
+        }
+
+    def set_frame_annotated(self, frame_idx, annotated):
+        """Record that frame_idx got its first bbox (True) or lost its last one (False)"""
+        if frame_idx not in self.sampled_frames:
+            return
+        segment = self.sampled_frames.index(frame_idx)
+        if annotated:
+            self.completed_segments.add(segment)
+        else:
+            self.completed_segments.discard(segment)
+
+    def discount_track_id(self, track_id):
+        """Decrease bbox count of track_id (drop it at 0)"""
+        self.track_id_counts[track_id] -= 1
+        if self.track_id_counts[track_id] <= 0:
+            del self.track_id_counts[track_id]
+
+    def get_track_ids(self):
+        """Sorted track IDs that have at least one bbox"""
+        return sorted(self.track_id_counts)
+
     def remove_last_bbox(self):
         """Remove the last bounding box from current frame"""
-        if self.current_frame in self.frame_bboxes:
-            bboxes = self.frame_bboxes[self.current_frame]
-            if bboxes:
-                removed = bboxes.pop()
-                print(f"Removed bbox: {removed['object_type']} - {removed['track_id']}")
-                self.update()  # Trigger repaint
+        bboxes = self.frame_bboxes.get(self.current_frame)
+        if bboxes:
+            removed = bboxes.pop()
+            self.bbox_count -= 1
+            self.discount_track_id(removed['track_id'])
+            if not bboxes:
+                self.set_frame_annotated(self.current_frame, False)
+            print(f"Removed bbox: {removed['object_type']} - {removed['track_id']}")
+            self.update()  # Trigger repaint
 
-                self.notify_progress_update()
+            self.notify_progress_update()
 
-                return True
+            return True
         return False
 
     def notify_progress_update(self):
@@ -278,12 +467,13 @@ class VideoCanvas(QLabel):
         주어진 위치에서 가장 작은 BBox를 찾아 반환
         Returns: (bbox_dict, bbox_index) 또는 (None, None)
         """
-        if self.current_frame not in self.frame_bboxes:
+        frame_bboxes = self.frame_bboxes.get(self.current_frame)
+        if not frame_bboxes:
             return None, None
         
         candidates = []
         
-        for i, bbox in enumerate(self.frame_bboxes[self.current_frame]):
+        for i, bbox in enumerate(frame_bboxes):
             zone = self.get_bbox_zone(canvas_point, bbox)
             if zone != 'outside':
                 # 면적 계산
@@ -422,12 +612,16 @@ class VideoCanvas(QLabel):
 
     def delete_bbox_at_index(self, bbox_index):
         """지정된 인덱스의 BBox 삭제"""
-        if self.current_frame not in self.frame_bboxes:
+        bboxes = self.frame_bboxes.get(self.current_frame)
+        if bboxes is None:
             return False
         
-        bboxes = self.frame_bboxes[self.current_frame]
         if 0 <= bbox_index < len(bboxes):
             deleted_bbox = bboxes.pop(bbox_index)
+            self.bbox_count -= 1
+            self.discount_track_id(deleted_bbox['track_id'])
+            if not bboxes:
+                self.set_frame_annotated(self.current_frame, False)
             
             # 선택된 BBox가 삭제된 경우 선택 해제
             if self.selected_bbox_index == bbox_index:
@@ -790,16 +984,13 @@ class VideoCanvas(QLabel):
             (right, (top + bottom) // 2),   # Right-Center
         ]
         
-        for handle_x, handle_y in handle_positions:
-            # 핸들을 중심점 기준으로 그리기
-            handle_rect = QRect(
-                handle_x - half_size, 
-                handle_y - half_size, 
-                handle_size, 
-                handle_size
-            )
-            painter.drawRect(handle_rect)
-            painter.setBrush(QBrush(Qt.NoBrush))
+        # 핸들을 중심점 기준으로 한 번에 그리기
+        handle_rects = [
+            QRect(handle_x - half_size, handle_y - half_size, handle_size, handle_size)
+            for handle_x, handle_y in handle_positions
+        ]
+        painter.drawRects(handle_rects)
+        painter.setBrush(QBrush(Qt.NoBrush))
 
     def draw_preview_bbox(self, painter):
         """Draw preview bbox while drawing"""
@@ -817,20 +1008,18 @@ class VideoCanvas(QLabel):
 
     def draw_existing_bboxes(self, painter):
         """기존 BBox들 그리기 - 디버그 버전"""
-        if self.current_frame not in self.frame_bboxes:
+        frame_bboxes = self.frame_bboxes.get(self.current_frame)
+        if not frame_bboxes:
             return
         
         if not painter.isActive():
             return
         
-        # print(f"Drawing bboxes for frame {self.current_frame}: {len(self.frame_bboxes[self.current_frame])} boxes")
+        # print(f"Drawing bboxes for frame {self.current_frame}: {len(frame_bboxes)} boxes")
         
-        for i, bbox in enumerate(self.frame_bboxes[self.current_frame]):
+        for i, bbox in enumerate(frame_bboxes):
             # 색상 설정
-            if bbox['track_id'] in self.track_registry:
-                color = QColor(*self.track_registry[bbox['track_id']])
-            else:
-                color = QColor(255, 0, 0)
+            color = self.track_registry.get(bbox['track_id'], self.default_bbox_color)
 
             is_selected = (self.selected_bbox_index == i)
             
@@ -849,64 +1038,37 @@ class VideoCanvas(QLabel):
 
     def canvas_to_padded_coords(self, canvas_point):
         """캔버스 좌표 → 패딩 포함 좌표 (새로운 함수)"""
-        if not self.pixmap():
+        if self.display_transform is None:
             return None
         
-        pixmap = self.pixmap()
-        canvas_rect = self.rect()
-        pixmap_rect = pixmap.rect()
+        # image_width: 360도 모드에서는 패딩 포함 폭
+        x_offset, y_offset, pixmap_width, pixmap_height, image_width, image_height = self.display_transform
         
         # 캔버스에서 픽맵으로 변환
-        x_offset = (canvas_rect.width() - pixmap_rect.width()) // 2
-        y_offset = (canvas_rect.height() - pixmap_rect.height()) // 2
-        
         pixmap_x = canvas_point.x() - x_offset
         pixmap_y = canvas_point.y() - y_offset
         
         # 범위 체크
-        if pixmap_x < 0 or pixmap_x >= pixmap_rect.width() or pixmap_y < 0 or pixmap_y >= pixmap_rect.height():
+        if pixmap_x < 0 or pixmap_x >= pixmap_width or pixmap_y < 0 or pixmap_y >= pixmap_height:
             return None
         
-        if self.is_360_mode:
-            # 360도: 패딩 포함 좌표
-            padding_width = int(self.original_width * self.padding_ratio)
-            total_width = self.original_width + 2 * padding_width
-            
-            padded_x = pixmap_x * total_width / pixmap_rect.width()
-            padded_y = pixmap_y * self.original_height / pixmap_rect.height()
-            
-            return (int(round(padded_x)), int(round(padded_y)))
-        else:
-            # 일반 모드
-            img_x = pixmap_x * self.original_width / pixmap_rect.width()
-            img_y = pixmap_y * self.original_height / pixmap_rect.height()
-            
-            return (int(round(img_x)), int(round(img_y)))
+        padded_x = pixmap_x * image_width / pixmap_width
+        padded_y = pixmap_y * image_height / pixmap_height
+        
+        return (int(round(padded_x)), int(round(padded_y)))
 
     def padded_to_canvas_coords(self, padded_point):
         """패딩 포함 좌표 → 캔버스 좌표 (새로운 함수)"""
-        if not self.pixmap():
+        if self.display_transform is None:
             return None
         
         padded_x, padded_y = padded_point
-        pixmap = self.pixmap()
-        canvas_rect = self.rect()
-        pixmap_rect = pixmap.rect()
+        x_offset, y_offset, pixmap_width, pixmap_height, image_width, image_height = self.display_transform
         
-        if self.is_360_mode:
-            padding_width = int(self.original_width * self.padding_ratio)
-            total_width = self.original_width + 2 * padding_width
-            
-            pixmap_x = padded_x * pixmap_rect.width() / total_width
-            pixmap_y = padded_y * pixmap_rect.height() / self.original_height
-        else:
-            pixmap_x = padded_x * pixmap_rect.width() / self.original_width
-            pixmap_y = padded_y * pixmap_rect.height() / self.original_height
+        pixmap_x = padded_x * pixmap_width / image_width
+        pixmap_y = padded_y * pixmap_height / image_height
         
         # 캔버스 좌표로 변환
-        x_offset = (canvas_rect.width() - pixmap_rect.width()) // 2
-        y_offset = (canvas_rect.height() - pixmap_rect.height()) // 2
-        
         canvas_x = int(round(pixmap_x + x_offset))
         canvas_y = int(round(pixmap_y + y_offset))
         
@@ -917,13 +1079,11 @@ class VideoCanvas(QLabel):
         from gui.bbox_dialog import BBoxAnnotationDialog
         
         # 현재 프레임 트랙 ID 수집
-        current_frame_track_ids = []
-        if self.current_frame in self.frame_bboxes:
-            current_frame_track_ids = [bbox['track_id'] for bbox in self.frame_bboxes[self.current_frame]]
+        current_frame_track_ids = frozenset(bbox['track_id'] for bbox in self.frame_bboxes.get(self.current_frame, ()))
         
         dialog = BBoxAnnotationDialog(
             available_objects=self.available_objects,
-            existing_track_ids=self.existing_track_ids.copy(),
+            existing_track_ids=self.existing_track_ids,
             current_frame_track_ids=current_frame_track_ids,
             last_selected_object=self.last_selected_object_type,
             parent=self
@@ -962,12 +1122,12 @@ class VideoCanvas(QLabel):
             return
         
         added_count = 0
+        skipped_frames = []
         for frame_idx in sampled_frames:
-            if frame_idx in self.frame_bboxes:
-                existing_track_ids = [bbox['track_id'] for bbox in self.frame_bboxes[frame_idx]]
-                if track_id in existing_track_ids:
-                    print(f"Skipping frame {frame_idx} - track_id {track_id} already exists")
-                    continue
+            frame_bboxes = self.frame_bboxes.get(frame_idx, ())
+            if any(bbox['track_id'] == track_id for bbox in frame_bboxes):
+                skipped_frames.append(frame_idx)
+                continue
             
             bbox = {
                 'x': x,
@@ -983,12 +1143,18 @@ class VideoCanvas(QLabel):
             
             self.frame_bboxes[frame_idx].append(bbox)
             added_count += 1
+            if len(self.frame_bboxes[frame_idx]) == 1:
+                self.set_frame_annotated(frame_idx, True)
+
+        self.bbox_count += added_count
+        if added_count:
+            self.track_id_counts[track_id] += added_count
+
+        # 프레임별 출력 대신 한 줄로 요약
+        if skipped_frames:
+            print(f"Skipped {len(skipped_frames)} frames - track_id {track_id} already exists: {skipped_frames}")
         
-        if object_type not in self.existing_track_ids:
-            self.existing_track_ids[object_type] = []
-        
-        if track_id not in self.existing_track_ids[object_type]:
-            self.existing_track_ids[object_type].append(track_id)
+        self.existing_track_ids.setdefault(object_type, set()).add(track_id)
         
         # print(f'Successfully added static bbox to {added_count} frames: {object_type}-{track_id}')
         self.update()
@@ -1019,13 +1185,13 @@ class VideoCanvas(QLabel):
             self.frame_bboxes[self.current_frame] = []
         
         self.frame_bboxes[self.current_frame].append(bbox)
+        self.bbox_count += 1
+        self.track_id_counts[track_id] += 1
+        if len(self.frame_bboxes[self.current_frame]) == 1:
+            self.set_frame_annotated(self.current_frame, True)
         
         # 트랙 ID 레지스트리 업데이트
-        if object_type not in self.existing_track_ids:
-            self.existing_track_ids[object_type] = []
-        
-        if track_id not in self.existing_track_ids[object_type]:
-            self.existing_track_ids[object_type].append(track_id)
+        self.existing_track_ids.setdefault(object_type, set()).add(track_id)
         
         # print(f'Successfully added bbox: {object_type}-{track_id}')
         self.update()
@@ -1393,19 +1559,7 @@ class VideoCanvas(QLabel):
             bfov_data = self.calculate_bfov_from_original_coords(original_bbox)
         
         # 3. 저장용 최종 형식 생성
-        save_data = {
-            # 기본 정보
-            'object_type': original_bbox['object_type'],
-            'track_id': original_bbox['track_id'],
-            
-            # 픽셀 좌표 (원본 영상 기준)
-            'pixel_coords': {
-                'x': original_bbox['x'],
-                'y': original_bbox['y'],
-                'width': original_bbox['width'],
-                'height': original_bbox['height']
-            },
-        }
+        save_data = self.make_save_dict(original_bbox)
         
         # 360도 추가 정보
         if self.is_360_mode:
@@ -1434,6 +1588,30 @@ class VideoCanvas(QLabel):
         
         return save_data
 
+    def make_save_dict(self, original_bbox):
+        """저장 형식의 기본 정보 + 픽셀 좌표 (원본 영상 좌표 bbox 기준)"""
+        return {
+            # 기본 정보
+            'object_type': original_bbox['object_type'],
+            'track_id': original_bbox['track_id'],
+            
+            # 픽셀 좌표 (원본 영상 기준)
+            'pixel_coords': {
+                'x': original_bbox['x'],
+                'y': original_bbox['y'],
+                'width': original_bbox['width'],
+                'height': original_bbox['height']
+            },
+        }
+
+    def convert_bboxes_for_save(self, bboxes):
+        """저장용: 한 프레임의 BBox 목록을 한 번에 변환"""
+        if self.is_360_mode:
+            return [self.convert_bbox_for_save(bbox) for bbox in bboxes]
+
+        # 일반 모드: 이미 원본 좌표 / BFoV 없음 - 좌표 변환용 중간 dict 생략
+        return [self.make_save_dict(bbox) for bbox in bboxes]
+
     # main_window.py의 get_current_annotation_with_qa() 함수에서 사용
     def get_save_format_annotations(self):
         """저장용으로 변환된 어노테이션 데이터 반환"""
@@ -10,8 +10,18 @@ import sys
 from PySide6.QtWidgets import QApplication
 from gui.main_window import MainWindow
 
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gui", "app.qss")
+
 def main():
     app = QApplication(sys.argv)
+
+    # App-wide stylesheet: parsed once for all widgets
+    if os.path.exists(STYLESHEET_PATH):
+        with open(STYLESHEET_PATH, "r", encoding="utf-8") as f:
+            app.setStyleSheet(f.read())
+    else:
+        print(f"Warning: Stylesheet not found at {STYLESHEET_PATH}")
+
     window = MainWindow()
     window.show()
     sys.exit(app.exec())